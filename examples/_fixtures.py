@@ -0,0 +1,73 @@
+"""
+Shared fixture builders for the example scripts.
+
+Players and registrations are cached by their inputs, so demos that build the
+same field more than once (e.g. the INFO and DEBUG runs in logging_demo.py)
+reuse the objects instead of rebuilding them. UUIDs come from a seeded
+random.Random: player IDs are the same on every run, and registration IDs are
+the same for a given tournament ID (the examples use a fresh uuid4() per run).
+
+Cached objects are shared between callers - treat them as read-only.
+"""
+
+import random
+from datetime import datetime, timezone
+from functools import lru_cache
+from uuid import UUID, uuid4
+
+from src.models.base import ComponentStatus, ComponentType, PlayerStatus
+from src.models.match import Component
+from src.models.player import Player
+from src.models.tournament import TournamentRegistration
+
+
+def _seeded_uuids(count: int, seed: int) -> list[UUID]:
+    """Generate `count` reproducible version 4 UUIDs from `seed`."""
+    # Reproducible demo IDs, not security tokens
+    rng = random.Random(seed)  # noqa: S311
+    return [UUID(int=rng.getrandbits(128), version=4) for _ in range(count)]
+
+
+@lru_cache(maxsize=32)
+def make_players(count: int, seed: int = 0) -> tuple[Player, ...]:
+    """Create `count` players named "Player 1".."Player N"."""
+    now = datetime.now(timezone.utc)
+    return tuple(
+        Player(id=player_id, name=f"Player {i + 1}", created_at=now)
+        for i, player_id in enumerate(_seeded_uuids(count, seed))
+    )
+
+
+@lru_cache(maxsize=32)
+def make_registrations(
+    tournament_id: UUID, count: int, seed: int = 0
+) -> tuple[TournamentRegistration, ...]:
+    """Register the players from make_players(count, seed) for a tournament."""
+    players = make_players(count, seed)
+    now = datetime.now(timezone.utc)
+    registration_ids = _seeded_uuids(count, seed ^ tournament_id.int)
+    return tuple(
+        TournamentRegistration(
+            id=registration_id,
+            tournament_id=tournament_id,
+            player_id=player.id,
+            sequence_id=i + 1,
+            status=PlayerStatus.ACTIVE,
+            registration_time=now,
+        )
+        for i, (player, registration_id) in enumerate(zip(players, registration_ids, strict=True))
+    )
+
+
+def make_component(tournament_id: UUID, component_id: UUID | None = None) -> Component:
+    """Create an active Swiss component (not cached - its status is mutable)."""
+    return Component(
+        id=component_id or uuid4(),
+        tournament_id=tournament_id,
+        type=ComponentType.SWISS,
+        name="Swiss Rounds",
+        sequence_order=1,
+        status=ComponentStatus.ACTIVE,
+        config={},
+        created_at=datetime.now(timezone.utc),
+    )
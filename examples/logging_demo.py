@@ -12,54 +12,14 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from uuid import uuid4
+
+from _fixtures import make_component, make_registrations
 from src.logging_config import setup_logging
 from src.swiss import pair_round_1, pair_round
-from uuid import uuid4
-from datetime import datetime, timezone
-
-from src.models.player import Player
-from src.models.tournament import TournamentRegistration
-from src.models.match import Component
-from src.models.base import ComponentType, ComponentStatus, PlayerStatus
-
-
-def create_test_players(count: int) -> list[Player]:
-    """Create test players."""
-    return [
-        Player(id=uuid4(), name=f"Player {i+1}", created_at=datetime.now(timezone.utc))
-        for i in range(count)
-    ]
-
-
-def create_registrations(
-    tournament_id, players: list[Player]
-) -> list[TournamentRegistration]:
-    """Create tournament registrations."""
-    return [
-        TournamentRegistration(
-            id=uuid4(),
-            tournament_id=tournament_id,
-            player_id=player.id,
-            sequence_id=i + 1,
-            status=PlayerStatus.ACTIVE,
-            registration_time=datetime.now(timezone.utc),
-        )
-        for i, player in enumerate(players)
-    ]
-
-
-def create_component(tournament_id):
-    """Create a Swiss component."""
-    return Component(
-        id=uuid4(),
-        tournament_id=tournament_id,
-        type=ComponentType.SWISS,
-        name="Swiss Rounds",
-        sequence_order=1,
-        status=ComponentStatus.ACTIVE,
-        config={},
-        created_at=datetime.now(timezone.utc),
-    )
+
+# Both demos run the same tournament, so the cached registrations are reused
+DEMO_TOURNAMENT_ID = uuid4()
 
 
 def demo_info_logging():
@@ -71,10 +31,8 @@ def demo_info_logging():
     setup_logging(level="INFO", console=True, detailed=False)
 
     # Create 8-player tournament
-    tournament_id = uuid4()
-    component = create_component(tournament_id)
-    players = create_test_players(8)
-    registrations = create_registrations(tournament_id, players)
+    component = make_component(DEMO_TOURNAMENT_ID)
+    registrations = list(make_registrations(DEMO_TOURNAMENT_ID, 8))
 
     # Round 1
     print("\n--- Round 1 Pairing ---")
@@ -100,10 +58,8 @@ def demo_debug_logging():
     setup_logging(level="DEBUG", console=True, detailed=False)
 
     # Create 8-player tournament
-    tournament_id = uuid4()
-    component = create_component(tournament_id)
-    players = create_test_players(8)
-    registrations = create_registrations(tournament_id, players)
+    component = make_component(DEMO_TOURNAMENT_ID)
+    registrations = list(make_registrations(DEMO_TOURNAMENT_ID, 8))
 
     # Round 1
     print("\n--- Round 1 Pairing ---")
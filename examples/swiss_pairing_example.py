@@ -11,22 +11,15 @@ AIA EAI Hin R Claude Code [Sonnet 4.5] v1.0
 
 import sys
 from pathlib import Path
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from datetime import datetime, timezone
-from uuid import uuid4
+from uuid import UUID, uuid4
+
+from _fixtures import make_component, make_players, make_registrations
 
-from src.models.player import Player
-from src.models.tournament import Tournament, TournamentRegistration, RegistrationControl
-from src.models.match import Match, Component
-from src.models.base import (
-    TournamentStatus,
-    TournamentVisibility,
-    PlayerStatus,
-    ComponentType,
-    ComponentStatus,
-)
-from src.swiss import pair_round_1, pair_round, calculate_standings
+from src.models.match import Match
+from src.swiss import calculate_standings, pair_round, pair_round_1
 
 
 def print_section(title: str):
@@ -36,38 +29,71 @@ def print_section(title: str):
     print("=" * 80 + "\n")
 
 
-def print_pairings(round_num: int, pairings: list[Match], players_by_id: dict):
+def name_pairings(
+    pairings: list[Match], seq_of: dict[UUID, int], names_by_seq: dict[int, str]
+) -> list[tuple[Match, str, str | None]]:
+    """
+    Attach player names to each pairing once, right after the round is paired.
+
+    Match is a pydantic model, so the names travel alongside it as
+    (match, player1_name, player2_name) rows instead of as extra attributes.
+    """
+    return [
+        (
+            match,
+            names_by_seq[seq_of[match.player1_id]],
+            names_by_seq[seq_of[match.player2_id]] if match.player2_id is not None else None,
+        )
+        for match in pairings
+    ]
+
+
+def print_pairings(round_num: int, named_pairings: list[tuple[Match, str, str | None]]):
     """Print round pairings."""
     print(f"ROUND {round_num} PAIRINGS:")
     print("-" * 80)
-    for i, match in enumerate(pairings, 1):
-        p1_name = players_by_id[match.player1_id].name
-        if match.player2_id is None:
+    for match, p1_name, p2_name in named_pairings:
+        if p2_name is None:
             print(f"  Table {match.table_number or 'BYE'}: {p1_name} - BYE")
         else:
-            p2_name = players_by_id[match.player2_id].name
             print(f"  Table {match.table_number}: {p1_name} vs {p2_name}")
     print()
 
 
-def print_standings(standings, players_by_id: dict):
-    """Print current standings."""
-    print("CURRENT STANDINGS:")
-    print("-" * 80)
-    print(f"{'Rank':<6} {'Player':<15} {'Record':<10} {'Points':<8} {'OMW%':<8} {'GW%':<8}")
-    print("-" * 80)
+def print_standings(standings, names_by_seq: dict[int, str]):
+    """Print current standings (table is built first, then written in one call)."""
+    lines = [
+        "CURRENT STANDINGS:",
+        "-" * 80,
+        f"{'Rank':<6} {'Player':<15} {'Record':<10} {'Points':<8} {'OMW%':<8} {'GW%':<8}",
+        "-" * 80,
+    ]
 
     for entry in standings:
-        player_name = players_by_id[entry.player.player_id].name
+        player_name = names_by_seq[entry.player.sequence_id]
         record = f"{entry.wins}-{entry.losses}-{entry.draws}"
-        omw = entry.tiebreakers.get("omw", 0.0)
-        gw = entry.tiebreakers.get("gw", 0.0)
+        tb = entry.tiebreakers
+        omw = tb.get("omw", 0.0)
+        gw = tb.get("gw", 0.0)
 
-        print(
+        lines.append(
             f"{entry.rank:<6} {player_name:<15} {record:<10} "
             f"{entry.match_points:<8} {omw:>6.2f}%  {gw:>6.2f}%"
         )
-    print()
+
+    sys.stdout.write("\n".join(lines) + "\n\n")
+
+
+def pair_key(match: Match, seq_of: dict[UUID, int]) -> tuple[int, int]:
+    """
+    Order-independent key for a pairing (A vs B == B vs A).
+
+    Uses the players' sequence_ids: a sorted 2-tuple of small ints is cheaper
+    to build, hash, and compare than a frozenset of UUIDs.
+    """
+    s1 = seq_of[match.player1_id]
+    s2 = seq_of[match.player2_id]
+    return (s1, s2) if s1 < s2 else (s2, s1)
 
 
 def simulate_round_results(pairings: list[Match], results: list[tuple[int, int]]):
@@ -78,7 +104,7 @@ def simulate_round_results(pairings: list[Match], results: list[tuple[int, int]]
         pairings: List of matches to update
         results: List of (player1_wins, player2_wins) tuples
     """
-    for match, (p1_wins, p2_wins) in zip(pairings, results):
+    for match, (p1_wins, p2_wins) in zip(pairings, results, strict=True):
         match.player1_wins = p1_wins
         match.player2_wins = p2_wins
         match.draws = 0  # No draws in this example
@@ -91,42 +117,20 @@ def main():
 
     # Setup tournament
     tournament_id = uuid4()
-    component_id = uuid4()
-
-    component = Component(
-        id=component_id,
-        tournament_id=tournament_id,
-        type=ComponentType.SWISS,
-        name="Swiss Rounds",
-        sequence_order=1,
-        status=ComponentStatus.ACTIVE,
-        config={},
-    )
-
-    # Create 8 players
-    players = [
-        Player(id=uuid4(), name=f"Player {i+1}", created_at=datetime.now(timezone.utc))
-        for i in range(8)
-    ]
+    component = make_component(tournament_id)
 
-    registrations = [
-        TournamentRegistration(
-            id=uuid4(),
-            tournament_id=tournament_id,
-            player_id=player.id,
-            sequence_id=i + 1,
-            status=PlayerStatus.ACTIVE,
-            registration_time=datetime.now(timezone.utc),
-        )
-        for i, player in enumerate(players)
-    ]
+    # Create 8 players (shared, cached fixtures)
+    players = make_players(8)
+    registrations = list(make_registrations(tournament_id, 8))
 
-    # Create lookup
-    players_by_id = {p.id: p for p in players}
+    # Key lookups by sequence_id (a small int) rather than UUID:
+    # player_id -> sequence_id is resolved once, names are looked up by sequence_id
+    seq_of = {r.player_id: r.sequence_id for r in registrations}
+    names_by_seq = {r.sequence_id: players[i].name for i, r in enumerate(registrations)}
 
     print("Tournament setup complete:")
     print(f"  Players: {len(players)}")
-    print(f"  Format: Swiss (3 rounds)")
+    print("  Format: Swiss (3 rounds)")
     print()
 
     # Configuration for tiebreakers
@@ -143,7 +147,7 @@ def main():
     print_section("ROUND 1 - RANDOM PAIRING")
 
     round1_pairings = pair_round_1(registrations, component, mode="random")
-    print_pairings(1, round1_pairings, players_by_id)
+    print_pairings(1, name_pairings(round1_pairings, seq_of, names_by_seq))
 
     # Simulate results (4 matches, varying game scores)
     round1_results = [
@@ -156,7 +160,7 @@ def main():
 
     print("Results reported. Calculating standings...")
     standings_r1 = calculate_standings(registrations, round1_pairings, config)
-    print_standings(standings_r1, players_by_id)
+    print_standings(standings_r1, names_by_seq)
 
     # =========================================================================
     # ROUND 2 - Standings-Based Pairing
@@ -174,18 +178,12 @@ def main():
         config,
         round_number=2,
     )
-    print_pairings(2, round2_pairings, players_by_id)
+    print_pairings(2, name_pairings(round2_pairings, seq_of, names_by_seq))
 
     # Verify no rematches
     print("Verifying no rematches from Round 1...")
-    round1_pairs = {
-        frozenset([m.player1_id, m.player2_id])
-        for m in round1_pairings if m.player2_id is not None
-    }
-    round2_pairs = {
-        frozenset([m.player1_id, m.player2_id])
-        for m in round2_pairings if m.player2_id is not None
-    }
+    round1_pairs = {pair_key(m, seq_of) for m in round1_pairings if m.player2_id is not None}
+    round2_pairs = {pair_key(m, seq_of) for m in round2_pairings if m.player2_id is not None}
 
     rematches = round1_pairs & round2_pairs
     if rematches:
@@ -206,7 +204,7 @@ def main():
     print("Results reported. Calculating standings...")
     all_matches = round1_pairings + round2_pairings
     standings_r2 = calculate_standings(registrations, all_matches, config)
-    print_standings(standings_r2, players_by_id)
+    print_standings(standings_r2, names_by_seq)
 
     # =========================================================================
     # ROUND 3 - Complex Standings
@@ -224,14 +222,11 @@ def main():
         config,
         round_number=3,
     )
-    print_pairings(3, round3_pairings, players_by_id)
+    print_pairings(3, name_pairings(round3_pairings, seq_of, names_by_seq))
 
     # Verify no rematches from previous rounds
     print("Verifying no rematches from Rounds 1 or 2...")
-    round3_pairs = {
-        frozenset([m.player1_id, m.player2_id])
-        for m in round3_pairings if m.player2_id is not None
-    }
+    round3_pairs = {pair_key(m, seq_of) for m in round3_pairings if m.player2_id is not None}
 
     all_prev_pairs = round1_pairs | round2_pairs
     rematches = all_prev_pairs & round3_pairs
@@ -253,7 +248,7 @@ def main():
     print("Results reported. Calculating FINAL standings...")
     all_matches = round1_pairings + round2_pairings + round3_pairings
     final_standings = calculate_standings(registrations, all_matches, config)
-    print_standings(final_standings, players_by_id)
+    print_standings(final_standings, names_by_seq)
 
     # =========================================================================
     # SUMMARY
@@ -261,13 +256,13 @@ def main():
 
     print_section("TOURNAMENT SUMMARY")
 
-    print(f"Total rounds: 3")
+    print("Total rounds: 3")
     print(f"Total matches: {len(all_matches)}")
     print()
 
     print("CHAMPION:")
     winner = final_standings[0]
-    winner_name = players_by_id[winner.player.player_id].name
+    winner_name = names_by_seq[winner.player.sequence_id]
     print(f"  🏆 {winner_name}")
     print(f"     Record: {winner.wins}-{winner.losses}-{winner.draws}")
     print(f"     Match Points: {winner.match_points}")
@@ -277,8 +272,9 @@ def main():
 
     print("TOP 4:")
     for i, entry in enumerate(final_standings[:4], 1):
-        player_name = players_by_id[entry.player.player_id].name
-        print(f"  {i}. {player_name} ({entry.wins}-{entry.losses}-{entry.draws}, {entry.match_points} pts)")
+        player_name = names_by_seq[entry.player.sequence_id]
+        record = f"{entry.wins}-{entry.losses}-{entry.draws}"
+        print(f"  {i}. {player_name} ({record}, {entry.match_points} pts)")
     print()
 
     print("✓ Swiss pairing algorithm demonstration complete!")
@@ -17,38 +17,40 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from uuid import uuid4
 
-from src.models.tournament import TournamentRegistration
+from _fixtures import make_registrations
 from src.models.match import Match
-from src.models.base import PlayerStatus
 from src.swiss.standings import calculate_standings
 
 
 def print_standings_table(standings, title="STANDINGS"):
-    """Print standings in a formatted table."""
-    print()
-    print("=" * 100)
-    print(title)
-    print("=" * 100)
-    print(
-        f"{'Rank':<6} {'Player':<12} {'Record':<10} {'Pts':<5} {'MW%':<8} {'GW%':<8} {'OMW%':<8} {'OGW%':<8}"
-    )
-    print("-" * 100)
+    """Print standings in a formatted table (built first, then written in one call)."""
+    lines = [
+        "",
+        "=" * 100,
+        title,
+        "=" * 100,
+        f"{'Rank':<6} {'Player':<12} {'Record':<10} {'Pts':<5} {'MW%':<8} {'GW%':<8} {'OMW%':<8} {'OGW%':<8}",
+        "-" * 100,
+    ]
 
     for entry in standings:
         record = f"{entry.wins}-{entry.losses}-{entry.draws}"
         player_name = f"Player {entry.player.sequence_id}"
 
         # Get tiebreaker values
-        mw = entry.tiebreakers.get("mw", 0.0)
-        gw = entry.tiebreakers.get("gw", 0.0)
-        omw = entry.tiebreakers.get("omw", 0.0)
-        ogw = entry.tiebreakers.get("ogw", 0.0)
+        tb = entry.tiebreakers
+        mw = tb.get("mw", 0.0)
+        gw = tb.get("gw", 0.0)
+        omw = tb.get("omw", 0.0)
+        ogw = tb.get("ogw", 0.0)
 
-        print(
+        lines.append(
             f"{entry.rank:<6} {player_name:<12} {record:<10} {entry.match_points:<5} "
             f"{mw*100:>6.2f}% {gw*100:>6.2f}% {omw*100:>6.2f}% {ogw*100:>6.2f}%"
         )
 
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
 def create_example_tournament():
     """
@@ -80,17 +82,8 @@ def create_example_tournament():
     tournament_id = uuid4()
     component_id = uuid4()
 
-    # Create 6 players
-    players = [
-        TournamentRegistration(
-            id=uuid4(),
-            tournament_id=tournament_id,
-            player_id=uuid4(),
-            sequence_id=i + 1,
-            status=PlayerStatus.ACTIVE,
-        )
-        for i in range(6)
-    ]
+    # Create 6 players (shared, cached fixtures)
+    players = list(make_registrations(tournament_id, 6))
 
     # Round 1 matches
     round1_matches = [
@@ -104,7 +104,10 @@ async def pair_round_endpoint(
         # Subsequent rounds: Swiss pairing by standings
         all_matches = await data_layer.matches.list_by_tournament(tournament_id)
         config = component.config or {}
-        matches = pair_round(registrations, all_matches, component, config, round_number)
+        # Registrations were fetched with status=ACTIVE, so pair_round needn't re-filter
+        matches = pair_round(
+            registrations, all_matches, component, config, round_number, active_only=True
+        )
 
     # Create round object if needed
     if create_new_round:
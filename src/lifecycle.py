@@ -33,43 +33,40 @@ def is_round_complete(round_obj: Round, matches: list[Match]) -> bool:
     Returns:
         True if round is complete, False otherwise
     """
-    logger.debug(
-        f"Checking round completion: round={round_obj.id}, "
-        f"round_number={round_obj.round_number}, status={round_obj.status.value}"
-    )
-
-    # If round is manually marked complete, trust that
+    # If round is manually marked complete, trust that (no logging or match scan)
     if round_obj.status == RoundStatus.COMPLETED:
-        logger.debug(f"Round {round_obj.round_number}: Manually marked as COMPLETED")
         return True
 
-    # Filter to only matches in this round
-    round_matches = [m for m in matches if m.round_id == round_obj.id]
-
-    logger.debug(f"Round {round_obj.round_number}: Found {len(round_matches)} matches")
-
-    # If no matches, round is not complete
-    if not round_matches:
-        logger.warning(f"Round {round_obj.round_number}: No matches found, marking incomplete")
-        return False
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Checking round completion: round=%s, round_number=%s, status=%s",
+            round_obj.id,
+            round_obj.round_number,
+            round_obj.status.value,
+        )
 
-    # Check if all matches have been completed
-    incomplete_count = 0
-    for match in round_matches:
-        # A match is complete if it has an end_time
+    # Filtering and the completion check share one pass that stops at the first
+    # unfinished match (a match is complete if it has an end_time)
+    round_id = round_obj.id
+    match_count = 0
+    for match in matches:
+        if match.round_id != round_id:
+            continue
         if match.end_time is None:
-            incomplete_count += 1
+            logger.debug("Round %s: Match %s still in progress", round_obj.round_number, match.id)
+            return False
+        match_count += 1
 
-    if incomplete_count > 0:
-        logger.info(
-            f"Round {round_obj.round_number}: {incomplete_count}/{len(round_matches)} matches "
-            f"still in progress"
-        )
+    # If no matches, round is not complete
+    if not match_count:
+        logger.warning("Round %s: No matches found, marking incomplete", round_obj.round_number)
         return False
 
     # All matches have been completed
     logger.info(
-        f"Round {round_obj.round_number}: COMPLETE - all {len(round_matches)} matches finished"
+        "Round %s: COMPLETE - all %d matches finished",
+        round_obj.round_number,
+        match_count,
     )
     return True
 
@@ -123,18 +120,24 @@ def advance_to_next_round(
     AIA EAI Hin R Claude Code [Sonnet 4.5] v1.0 - Updated for automatic tournament completion
     """
     logger.info(
-        f"Advancing from Round {current_round.round_number}: "
-        f"component={component_id}, max_rounds={max_rounds}, "
-        f"auto_complete={tournament is not None and component is not None}"
+        "Advancing from Round %s: component=%s, max_rounds=%s, auto_complete=%s",
+        current_round.round_number,
+        component_id,
+        max_rounds,
+        tournament is not None and component is not None,
     )
 
+    # One timestamp for the whole transition: this round's end is the next one's start
+    now = datetime.now(timezone.utc)
+
     # Mark current round as complete
     current_round.status = RoundStatus.COMPLETED
-    current_round.end_time = datetime.now(timezone.utc)
+    current_round.end_time = now
 
     logger.debug(
-        f"Round {current_round.round_number}: Marked as COMPLETED, "
-        f"end_time={current_round.end_time}"
+        "Round %s: Marked as COMPLETED, end_time=%s",
+        current_round.round_number,
+        current_round.end_time,
     )
 
     # Check if we've reached max rounds
@@ -142,8 +145,9 @@ def advance_to_next_round(
 
     if max_rounds is not None and next_round_number > max_rounds:
         logger.info(
-            f"Tournament complete: Reached maximum rounds ({max_rounds}), "
-            f"not creating Round {next_round_number}"
+            "Tournament complete: Reached maximum rounds (%s), not creating Round %s",
+            max_rounds,
+            next_round_number,
         )
 
         # Automatically end tournament if tournament and component provided
@@ -160,14 +164,16 @@ def advance_to_next_round(
         component_id=component_id,
         round_number=next_round_number,
         status=RoundStatus.ACTIVE,
-        start_time=datetime.now(timezone.utc),
+        start_time=now,
         end_time=None,
-        created_at=datetime.now(timezone.utc),
+        created_at=now,
     )
 
     logger.info(
-        f"Round {next_round_number} created: id={next_round.id}, status=ACTIVE, "
-        f"start_time={next_round.start_time}"
+        "Round %s created: id=%s, status=ACTIVE, start_time=%s",
+        next_round_number,
+        next_round.id,
+        next_round.start_time,
     )
 
     return next_round
@@ -188,7 +194,8 @@ def should_tournament_end(
     3. All players have played each other (impossible to continue)
 
     Args:
-        rounds: All rounds in the tournament
+        rounds: All rounds in the tournament, ordered by round_number (the order
+            start_tournament() and advance_to_next_round() create them in)
         matches: All matches in the tournament
         max_rounds: Optional maximum rounds
         min_rounds: Optional minimum rounds before checking for clear winner
@@ -200,20 +207,24 @@ def should_tournament_end(
         logger.debug("Tournament should not end: No rounds yet")
         return False
 
-    current_round_number = max(r.round_number for r in rounds)
+    # Rounds are appended in order, so the latest round is the last one
+    current_round_number = rounds[-1].round_number
 
     # Check max rounds limit
     if max_rounds is not None and current_round_number >= max_rounds:
         logger.info(
-            f"Tournament should end: Reached max rounds ({current_round_number}/{max_rounds})"
+            "Tournament should end: Reached max rounds (%s/%s)",
+            current_round_number,
+            max_rounds,
         )
         return True
 
     # Check if we've met minimum rounds requirement
     if min_rounds is not None and current_round_number < min_rounds:
         logger.debug(
-            f"Tournament should not end: Haven't reached min rounds "
-            f"({current_round_number}/{min_rounds})"
+            "Tournament should not end: Haven't reached min rounds (%s/%s)",
+            current_round_number,
+            min_rounds,
         )
         return False
 
@@ -222,7 +233,8 @@ def should_tournament_end(
     # For now, we rely on max_rounds
 
     logger.debug(
-        f"Tournament should not end: Round {current_round_number}, no termination conditions met"
+        "Tournament should not end: Round %s, no termination conditions met",
+        current_round_number,
     )
     return False
 
@@ -266,9 +278,11 @@ def start_tournament(
     AIA EAI Hin R Claude Code [Sonnet 4.5] v1.0 - TDD GREEN phase
     """
     logger.info(
-        f"Starting tournament: {tournament.name} (id={tournament.id}), "
-        f"current status={tournament.status.value}, "
-        f"players={len(registrations)}"
+        "Starting tournament: %s (id=%s), current status=%s, players=%d",
+        tournament.name,
+        tournament.id,
+        tournament.status.value,
+        len(registrations),
     )
 
     # Validate tournament state
@@ -292,8 +306,9 @@ def start_tournament(
         raise ValueError(error_msg)
 
     logger.debug(
-        f"Tournament state valid: status={tournament.status.value}, "
-        f"active_players={len(active_players)}"
+        "Tournament state valid: status=%s, active_players=%d",
+        tournament.status.value,
+        len(active_players),
     )
 
     # Transition tournament to IN_PROGRESS
@@ -301,13 +316,15 @@ def start_tournament(
     tournament.start_time = datetime.now(timezone.utc)
 
     logger.info(
-        f"Tournament started: status={tournament.status.value}, start_time={tournament.start_time}"
+        "Tournament started: status=%s, start_time=%s",
+        tournament.status.value,
+        tournament.start_time,
     )
 
     # Activate component
     component.status = ComponentStatus.ACTIVE
 
-    logger.debug(f"Component activated: {component.name} (id={component.id})")
+    logger.debug("Component activated: %s (id=%s)", component.name, component.id)
 
     # Create Round 1
     round1 = Round(
@@ -321,8 +338,10 @@ def start_tournament(
     )
 
     logger.info(
-        f"Round 1 created: id={round1.id}, status={round1.status.value}, "
-        f"start_time={round1.start_time}"
+        "Round 1 created: id=%s, status=%s, start_time=%s",
+        round1.id,
+        round1.status.value,
+        round1.start_time,
     )
 
     return round1
@@ -361,8 +380,10 @@ def end_tournament(
     AIA EAI Hin R Claude Code [Sonnet 4.5] v1.0 - TDD GREEN phase
     """
     logger.info(
-        f"Ending tournament: {tournament.name} (id={tournament.id}), "
-        f"current status={tournament.status.value}"
+        "Ending tournament: %s (id=%s), current status=%s",
+        tournament.name,
+        tournament.id,
+        tournament.status.value,
     )
 
     # Validate tournament state
@@ -379,10 +400,12 @@ def end_tournament(
     tournament.end_time = datetime.now(timezone.utc)
 
     logger.info(
-        f"Tournament completed: status={tournament.status.value}, end_time={tournament.end_time}"
+        "Tournament completed: status=%s, end_time=%s",
+        tournament.status.value,
+        tournament.end_time,
     )
 
     # Complete component
     component.status = ComponentStatus.COMPLETED
 
-    logger.debug(f"Component completed: {component.name} (id={component.id})")
+    logger.debug("Component completed: %s (id=%s)", component.name, component.id)
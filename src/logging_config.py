@@ -7,8 +7,10 @@ structured logging, and environment-specific configurations.
 AIA EAI Hin R Claude Code [Sonnet 4.5] v1.0
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
 
@@ -20,6 +22,20 @@ DETAILED_FORMAT = (
     "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(funcName)s - %(message)s"
 )
 
+# Background thread that owns the file handler (see setup_logging)
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the background logging thread, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 def setup_logging(
     level: str = "INFO",
@@ -30,6 +46,12 @@ def setup_logging(
     """
     Configure application-wide logging.
 
+    The console handler writes synchronously so log lines stay in order with
+    other stdout output. File records go through a QueueHandler to a background
+    QueueListener thread, so logging calls never block on disk I/O (or file
+    rotation). Calling this again stops the previous listener after flushing
+    its queue.
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional path to log file for persistent logging
@@ -41,6 +63,8 @@ def setup_logging(
         >>> logger = logging.getLogger("tournament")
         >>> logger.info("Tournament started")
     """
+    global _queue_listener
+
     # Convert string level to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
 
@@ -48,7 +72,8 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
-    # Clear any existing handlers
+    # Clear any existing handlers (flushing records queued by a previous setup)
+    _stop_queue_listener()
     root_logger.handlers.clear()
 
     # Select format
@@ -77,7 +102,14 @@ def setup_logging(
         file_handler.setLevel(numeric_level)
         # Always use detailed format for files
         file_handler.setFormatter(logging.Formatter(DETAILED_FORMAT, datefmt="%Y-%m-%d %H:%M:%S"))
-        root_logger.addHandler(file_handler)
+
+        # Route file records through a queue to a background thread that does the I/O
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -121,8 +153,12 @@ def log_tournament_event(
         ...     player_count=8
         ... )
     """
+    # Skip building the context string when INFO is filtered out
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     context_str = ", ".join(f"{k}={v}" for k, v in context.items())
-    logger.info(f"[Tournament {tournament_id}] {event} | {context_str}")
+    logger.info("[Tournament %s] %s | %s", tournament_id, event, context_str)
 
 
 def log_pairing_decision(
@@ -154,11 +190,19 @@ def log_pairing_decision(
         ...     bracket=6
         ... )
     """
+    # Skip building the context string when DEBUG is filtered out
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
     opponent = player2_id if player2_id else "BYE"
     context_str = ", ".join(f"{k}={v}" for k, v in context.items())
     logger.debug(
-        f"[Round {round_number}] Pairing: {player1_id} vs {opponent} | "
-        f"Reason: {reason} | {context_str}"
+        "[Round %s] Pairing: %s vs %s | Reason: %s | %s",
+        round_number,
+        player1_id,
+        opponent,
+        reason,
+        context_str,
     )
 
 
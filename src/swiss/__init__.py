@@ -8,7 +8,12 @@ AIA EAI Hin R Claude Code [Sonnet 4.5] v1.0
 """
 
 from .models import StandingsEntry
-from .pairing import generate_bye_losses_for_late_entry, pair_round, pair_round_1
+from .pairing import (
+    generate_bye_losses_for_late_entry,
+    pair_round,
+    pair_round_1,
+    update_pairing_history,
+)
 from .standings import calculate_standings
 from .tiebreakers import (
     calculate_game_win_percentage,
@@ -27,4 +32,5 @@ __all__ = [
     "pair_round_1",
     "pair_round",
     "generate_bye_losses_for_late_entry",
+    "update_pairing_history",
 ]
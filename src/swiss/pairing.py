@@ -8,10 +8,13 @@ AIA EAI Hin R Claude Code [Sonnet 4.5] v1.0
 """
 
 import logging
+import os
 import random
-from collections import defaultdict
+from itertools import groupby
+from operator import attrgetter
 from uuid import UUID, uuid4
 
+from src.models.base import PlayerStatus
 from src.models.match import Component, Match
 from src.models.tournament import TournamentRegistration
 from src.swiss.models import StandingsEntry
@@ -19,6 +22,47 @@ from src.swiss.standings import calculate_standings
 
 logger = logging.getLogger(__name__)
 
+# Shared "no opponents yet" set, so history lookups never allocate a throwaway set
+_EMPTY: frozenset[UUID] = frozenset()
+
+# Upper bound on search steps per bracket before falling back to greedy pairing
+_BRACKET_SEARCH_LIMIT = 10_000
+
+
+def _active_registrations(
+    registrations: list[TournamentRegistration],
+) -> list[TournamentRegistration]:
+    """Return the registrations that are still ACTIVE (not dropped), in order."""
+    return [reg for reg in registrations if reg.status == PlayerStatus.ACTIVE]
+
+
+def _bye_match(component: Component, round_id: UUID, round_number: int, player_id: UUID) -> Match:
+    """
+    Create a bye match: a 2-0 match win for `player_id` with no opponent or table.
+
+    Args:
+        component: Tournament component
+        round_id: ID of the round the bye belongs to
+        round_number: Round number
+        player_id: Player receiving the bye
+
+    Returns:
+        The bye Match
+    """
+    return Match(
+        id=uuid4(),
+        tournament_id=component.tournament_id,
+        component_id=component.id,
+        round_id=round_id,
+        round_number=round_number,
+        player1_id=player_id,
+        player2_id=None,  # None indicates bye
+        player1_wins=2,  # Bye counts as 2-0 win
+        player2_wins=0,
+        draws=0,
+        table_number=None,  # Byes don't get table numbers
+    )
+
 
 def pair_round_1(
     registrations: list[TournamentRegistration],
@@ -49,11 +93,7 @@ def pair_round_1(
         raise ValueError("Cannot pair empty player list")
 
     # Filter to only active players
-    active_players = [
-        reg
-        for reg in registrations
-        if reg.status.value == "active"  # PlayerStatus.ACTIVE
-    ]
+    active_players = _active_registrations(registrations)
 
     if not active_players:
         logger.error("No active players to pair")
@@ -72,12 +112,11 @@ def pair_round_1(
     # Sort/shuffle based on mode
     if mode == "random":
         logger.debug("Using random shuffle for Round 1 pairing")
-        players = list(active_players)
-        random.shuffle(players)
+        players = random.sample(active_players, len(active_players))
     elif mode == "seeded":
         logger.debug("Using seeded pairing (by sequence_id) for Round 1")
         # Pair by sequence_id: #1 vs #2, #3 vs #4, etc.
-        players = sorted(active_players, key=lambda p: p.sequence_id)
+        players = sorted(active_players, key=attrgetter("sequence_id"))
     else:
         logger.error(f"Invalid pairing mode: {mode}")
         raise ValueError(f"Invalid pairing mode: {mode}")
@@ -110,20 +149,7 @@ def pair_round_1(
         logger.info(
             f"Round 1: Odd player count, assigning bye to player=seq#{bye_player.sequence_id}"
         )
-        bye_match = Match(
-            id=uuid4(),
-            tournament_id=component.tournament_id,
-            component_id=component.id,
-            round_id=round_id,
-            round_number=1,
-            player1_id=bye_player.player_id,
-            player2_id=None,  # None indicates bye
-            player1_wins=2,  # Bye counts as 2-0 win
-            player2_wins=0,
-            draws=0,
-            table_number=None,  # Byes don't get table numbers
-        )
-        matches.append(bye_match)
+        matches.append(_bye_match(component, round_id, 1, bye_player.player_id))
 
     logger.info(
         f"Round 1 pairing complete: {len(matches)} matches created "
@@ -165,15 +191,20 @@ def generate_bye_losses_for_late_entry(
         f"current_round={current_round}, missed_rounds={missed_rounds}"
     )
 
-    bye_losses = []
+    if missed_rounds <= 0:
+        return []
 
-    for round_num in range(1, current_round):
-        bye_loss = Match(
-            id=uuid4(),
+    # Random bytes for every match id and phantom round id in one os.urandom call
+    # (uuid4() reads urandom separately for each id)
+    raw = os.urandom(32 * missed_rounds)
+
+    bye_losses = [
+        Match(
+            id=UUID(bytes=raw[32 * i : 32 * i + 16], version=4),
             tournament_id=component.tournament_id,
             component_id=component.id,
-            round_id=uuid4(),  # Phantom round ID
-            round_number=round_num,
+            round_id=UUID(bytes=raw[32 * i + 16 : 32 * i + 32], version=4),  # Phantom round ID
+            round_number=i + 1,
             player1_id=registration.player_id,
             player2_id=None,  # Bye opponent
             player1_wins=0,  # Loss
@@ -181,11 +212,12 @@ def generate_bye_losses_for_late_entry(
             draws=0,
             table_number=None,
         )
-        bye_losses.append(bye_loss)
-        logger.debug(
-            f"Created bye loss: player=seq#{registration.sequence_id}, "
-            f"round={round_num}, result=0-2"
-        )
+        for i in range(missed_rounds)
+    ]
+    logger.debug(
+        f"Created bye losses: player=seq#{registration.sequence_id}, "
+        f"rounds=1-{missed_rounds}, result=0-2"
+    )
 
     logger.info(f"Late entry bye losses created: {len(bye_losses)} losses")
 
@@ -199,6 +231,9 @@ def pair_round(
     config: dict,
     round_number: int,
     allow_rematches_override: bool | None = None,
+    pairing_history: dict[UUID, set[UUID]] | None = None,
+    precomputed_standings: list[StandingsEntry] | None = None,
+    active_only: bool = False,
 ) -> list[Match]:
     """
     Pair players for rounds 2+ using standings-based bracket pairing.
@@ -219,6 +254,16 @@ def pair_round(
         allow_rematches_override: If True, allows rematches when pairing is impossible.
             If None, uses config["allow_rematches"] (default: False).
             This is a per-round override for emergency situations.
+        pairing_history: Optional map of player_id -> opponents already faced in `matches`.
+            Callers pairing several rounds can keep one map and extend it with each
+            round's results via update_pairing_history() instead of rebuilding it here.
+        precomputed_standings: Optional standings of the active players for `matches`,
+            as returned by calculate_standings() (i.e. sorted by match points). Callers
+            that already have them (e.g. to display before pairing, or when re-pairing
+            a round) pass them in to skip recalculating.
+        active_only: Set to True when `registrations` is already filtered to ACTIVE
+            players (e.g. by a simulation loop that filters once up front), to skip
+            re-filtering them on every call.
 
     Returns:
         List of Match objects for this round
@@ -232,8 +277,8 @@ def pair_round(
         f"total_registrations={len(registrations)}, previous_matches={len(matches)}"
     )
 
-    # Filter to only active players
-    active_players = [reg for reg in registrations if reg.status.value == "active"]
+    # Filter to only active players (unless the caller already did)
+    active_players = registrations if active_only else _active_registrations(registrations)
 
     dropped_count = len(registrations) - len(active_players)
     if dropped_count > 0:
@@ -257,16 +302,21 @@ def pair_round(
             f"Tournament may have ended due to drops."
         )
 
-    # Calculate current standings
-    logger.debug(f"Round {round_number}: Calculating standings")
-    standings = calculate_standings(active_players, matches, config)
+    # Calculate current standings unless the caller already has them
+    if precomputed_standings is not None:
+        logger.debug(f"Round {round_number}: Using precomputed standings")
+        standings = precomputed_standings
+    else:
+        logger.debug(f"Round {round_number}: Calculating standings")
+        standings = calculate_standings(active_players, matches, config)
     logger.debug(
         f"Round {round_number}: Standings calculated, "
         f"top_player_points={standings[0].match_points if standings else 0}"
     )
 
-    # Build pairing history (who has played whom)
-    pairing_history = _build_pairing_history(matches)
+    # Build pairing history (who has played whom) unless the caller maintains one
+    if pairing_history is None:
+        pairing_history = _build_pairing_history(matches)
     total_previous_pairings = sum(len(opponents) for opponents in pairing_history.values()) // 2
     logger.debug(
         f"Round {round_number}: Pairing history built, "
@@ -280,7 +330,7 @@ def pair_round(
     if len(standings) % 2 == 1:
         logger.info(f"Round {round_number}: Odd player count, selecting bye recipient")
         # Find lowest-ranked player who hasn't had a bye yet
-        bye_player = _select_bye_player(standings, matches)
+        bye_player = _select_bye_player(standings)
         logger.info(
             f"Round {round_number}: Bye assigned to player=seq#{bye_player.player.sequence_id}, "
             f"rank={bye_player.rank}, points={bye_player.match_points}"
@@ -295,45 +345,25 @@ def pair_round(
     logger.info(f"Round {round_number}: Grouped players into {len(brackets)} bracket(s)")
     logger.debug(
         f"Round {round_number}: Bracket breakdown: "
-        f"{ {points: len(players) for points, players in brackets.items()} }"
+        f"{ {points: len(players) for points, players in brackets} }"
     )
 
-    # Pair players within brackets
-    new_matches: list[Match] = []
+    # Pair players within brackets. Each bracket is searched for a complete
+    # rematch-free pairing; if that leaves lower brackets unpairable, fall back
+    # to the plain greedy cascade.
     round_id = uuid4()
-    unpaired_players: list[StandingsEntry] = []
-
-    for match_points, bracket_entries in sorted(brackets.items(), reverse=True):
-        # Add any pair-downs from higher brackets
-        pair_down_count = len(unpaired_players)
-        bracket_players = list(bracket_entries) + unpaired_players
-        unpaired_players = []
-
+    new_matches, unpaired_players = _pair_brackets(
+        brackets, pairing_history, component, round_id, round_number, search=True
+    )
+    if unpaired_players:
         logger.debug(
-            f"Round {round_number}: Pairing bracket {match_points}pts: "
-            f"{len(bracket_players)} players ({len(bracket_entries)} in bracket, "
-            f"{pair_down_count} pair-downs)"
+            f"Round {round_number}: Bracket search left {len(unpaired_players)} unpaired, "
+            f"retrying with greedy pair-downs"
         )
-
-        # Try to pair players in this bracket
-        paired, unpaired = _pair_bracket(
-            bracket_players,
-            pairing_history,
-            component,
-            round_id,
-            round_number,
-            len(new_matches),
+        new_matches, unpaired_players = _pair_brackets(
+            brackets, pairing_history, component, round_id, round_number, search=False
         )
 
-        new_matches.extend(paired)
-        unpaired_players = unpaired
-
-        if len(paired) > 0:
-            logger.debug(
-                f"Round {round_number}: Bracket {match_points}pts: "
-                f"{len(paired)} matches created, {len(unpaired)} unpaired"
-            )
-
     # Handle any remaining unpaired players
     if len(unpaired_players) > 0:
         logger.warning(
@@ -373,20 +403,9 @@ def pair_round(
 
     # Add bye match if we have a bye player
     if bye_player is not None:
-        bye_match = Match(
-            id=uuid4(),
-            tournament_id=component.tournament_id,
-            component_id=component.id,
-            round_id=round_id,
-            round_number=round_number,
-            player1_id=bye_player.player.player_id,
-            player2_id=None,
-            player1_wins=2,
-            player2_wins=0,
-            draws=0,
-            table_number=None,
+        new_matches.append(
+            _bye_match(component, round_id, round_number, bye_player.player.player_id)
         )
-        new_matches.append(bye_match)
         logger.debug(
             f"Round {round_number}: Bye match added for player=seq#{bye_player.player.sequence_id}"
         )
@@ -482,13 +501,12 @@ def _raise_impossible_pairing_error(
     player_names = [f"Player {p.player.sequence_id}" for p in unpaired_players]
 
     # Check if these players have all played each other
+    ids = [entry.player.player_id for entry in unpaired_players]
     all_played_each_other = True
-    for i, player1 in enumerate(unpaired_players):
-        for player2 in unpaired_players[i + 1 :]:
-            if player2.player.player_id not in pairing_history.get(player1.player.player_id, set()):
-                all_played_each_other = False
-                break
-        if not all_played_each_other:
+    for i, player1_id in enumerate(ids):
+        played = pairing_history.get(player1_id, _EMPTY)
+        if any(player2_id not in played for player2_id in ids[i + 1 :]):
+            all_played_each_other = False
             break
 
     if all_played_each_other:
@@ -523,10 +541,7 @@ def _raise_impossible_pairing_error(
     raise ValueError(error_msg)
 
 
-def _select_bye_player(
-    standings: list[StandingsEntry],
-    matches: list[Match],
-) -> StandingsEntry:
+def _select_bye_player(standings: list[StandingsEntry]) -> StandingsEntry:
     """
     Select the player to receive a bye.
 
@@ -535,38 +550,65 @@ def _select_bye_player(
     2. If all have had byes, give to lowest-ranked (minimizes advantage)
 
     Args:
-        standings: Current standings (sorted by rank)
-        matches: All previous matches (to check bye history)
+        standings: Current standings (sorted by rank, carrying each player's bye_count)
 
     Returns:
         StandingsEntry for the player who should receive the bye
     """
-    # Count previous byes for each player
-    bye_counts: defaultdict[UUID, int] = defaultdict(int)
-    for match in matches:
-        if match.player2_id is None:  # Bye match
-            bye_counts[match.player1_id] += 1
-
-    # Find minimum bye count
-    min_byes = min((bye_counts.get(s.player.player_id, 0) for s in standings), default=0)
-
-    logger.debug(f"Bye selection: min_byes={min_byes}, total_players={len(standings)}")
-
-    # Get players with minimum byes (reverse order = lowest ranked first)
-    candidates = [
-        s for s in reversed(standings) if bye_counts.get(s.player.player_id, 0) == min_byes
-    ]
+    # Single walk from the bottom of the standings: keep the lowest-ranked player
+    # with the fewest byes (strict < keeps the earlier, lower-ranked one on ties)
+    selected = standings[-1]
+    min_byes = selected.bye_count
+    for entry in reversed(standings):
+        if entry.bye_count < min_byes:
+            selected, min_byes = entry, entry.bye_count
 
-    # Return lowest-ranked candidate
-    selected = candidates[0]
     logger.debug(
         f"Bye selection: Selected player=seq#{selected.player.sequence_id}, "
-        f"rank={selected.rank}, previous_byes={min_byes}"
+        f"rank={selected.rank}, previous_byes={min_byes}, total_players={len(standings)}"
     )
 
     return selected
 
 
+def update_pairing_history(
+    pairing_history: dict[UUID, set[UUID]],
+    matches: list[Match],
+) -> dict[UUID, set[UUID]]:
+    """
+    Record the pairings in `matches` in an existing pairing history (in place).
+
+    Lets callers that pair round after round keep a single history and add each
+    round's matches to it, rather than pair_round() rebuilding it from every
+    previous match.
+
+    Args:
+        pairing_history: Mapping of player_id -> set of opponent player_ids to extend
+        matches: Newly played matches
+
+    Returns:
+        The same pairing_history, for convenience
+    """
+    # Plain dict lookups: setdefault() would build a throwaway set() on every call
+    for match in matches:
+        player2_id = match.player2_id
+        if player2_id is None:  # Skip byes
+            continue
+        player1_id = match.player1_id
+
+        opponents = pairing_history.get(player1_id)
+        if opponents is None:
+            pairing_history[player1_id] = opponents = set()
+        opponents.add(player2_id)
+
+        opponents = pairing_history.get(player2_id)
+        if opponents is None:
+            pairing_history[player2_id] = opponents = set()
+        opponents.add(player1_id)
+
+    return pairing_history
+
+
 def _build_pairing_history(matches: list[Match]) -> dict[UUID, set[UUID]]:
     """
     Build a mapping of player_id -> set of opponent player_ids.
@@ -577,34 +619,92 @@ def _build_pairing_history(matches: list[Match]) -> dict[UUID, set[UUID]]:
     Returns:
         Dictionary mapping each player to set of opponents they've faced
     """
-    history = defaultdict(set)
+    # Nothing played yet (e.g. a defensive call before round 2)
+    if not matches:
+        return {}
 
-    for match in matches:
-        if match.player2_id is not None:  # Skip byes
-            history[match.player1_id].add(match.player2_id)
-            history[match.player2_id].add(match.player1_id)
-
-    return history
+    return update_pairing_history({}, matches)
 
 
 def _group_into_brackets(
     standings: list[StandingsEntry],
-) -> dict[int, list[StandingsEntry]]:
+) -> list[tuple[int, list[StandingsEntry]]]:
     """
     Group players into brackets by match points.
 
+    Standings are already sorted by match points (descending), so each bracket
+    is a contiguous run and one groupby pass yields them highest first.
+
     Args:
         standings: Sorted standings entries
 
     Returns:
-        Dictionary mapping match_points -> list of StandingsEntry objects
+        List of (match_points, StandingsEntry list) tuples, highest bracket first
+    """
+    return [
+        (match_points, list(entries))
+        for match_points, entries in groupby(standings, key=attrgetter("match_points"))
+    ]
+
+
+def _pair_brackets(
+    brackets: list[tuple[int, list[StandingsEntry]]],
+    pairing_history: dict[UUID, set[UUID]],
+    component: Component,
+    round_id: UUID,
+    round_number: int,
+    search: bool,
+) -> tuple[list[Match], list[StandingsEntry]]:
     """
-    brackets = defaultdict(list)
+    Pair brackets from the highest down, carrying unpaired players into the next.
 
-    for entry in standings:
-        brackets[entry.match_points].append(entry)
+    Args:
+        brackets: (match_points, players) tuples, highest bracket first
+        pairing_history: Who has played whom
+        component: Tournament component
+        round_id: ID for the round being paired
+        round_number: Round number
+        search: Search each bracket for a complete pairing (see _pair_bracket)
 
-    return brackets
+    Returns:
+        Tuple of (matches created, players left unpaired after the last bracket)
+    """
+    new_matches: list[Match] = []
+    unpaired_players: list[StandingsEntry] = []
+
+    for match_points, bracket_entries in brackets:
+        # Add any pair-downs from higher brackets
+        pair_down_count = len(unpaired_players)
+        bracket_players = list(bracket_entries) + unpaired_players
+        unpaired_players = []
+
+        logger.debug(
+            f"Round {round_number}: Pairing bracket {match_points}pts: "
+            f"{len(bracket_players)} players ({len(bracket_entries)} in bracket, "
+            f"{pair_down_count} pair-downs)"
+        )
+
+        # Try to pair players in this bracket
+        paired, unpaired = _pair_bracket(
+            bracket_players,
+            pairing_history,
+            component,
+            round_id,
+            round_number,
+            len(new_matches),
+            search=search,
+        )
+
+        new_matches.extend(paired)
+        unpaired_players = unpaired
+
+        if len(paired) > 0:
+            logger.debug(
+                f"Round {round_number}: Bracket {match_points}pts: "
+                f"{len(paired)} matches created, {len(unpaired)} unpaired"
+            )
+
+    return new_matches, unpaired_players
 
 
 def _pair_bracket(
@@ -614,14 +714,17 @@ def _pair_bracket(
     round_id: UUID,
     round_number: int,
     table_offset: int,
+    search: bool = True,
 ) -> tuple[list[Match], list[StandingsEntry]]:
     """
     Pair players within a bracket, avoiding rematches.
 
-    Uses a greedy algorithm:
-    1. Sort players by rank
-    2. Pair first player with highest-ranked opponent they haven't played
-    3. Repeat until all paired or pair-down needed
+    Players are taken in rank order and each is paired with the highest-ranked
+    opponent they haven't played. With `search`, a bounded backtracking search
+    revisits earlier choices when that greedy order would strand a player, so the
+    bracket is fully paired (one pair-down for an odd count) whenever a
+    rematch-free pairing exists. Otherwise, or if the search finds none, the plain
+    greedy pass decides who pairs down.
 
     Args:
         players: List of players in this bracket (and pair-downs from above)
@@ -630,43 +733,162 @@ def _pair_bracket(
         round_id: ID for the round being paired
         round_number: Round number
         table_offset: Starting table number
+        search: Search for a complete pairing before falling back to greedy
 
     Returns:
         Tuple of (matches created, unpaired players needing pair-down)
     """
-    matches: list[Match] = []
-    available = list(players)  # Copy to modify
-
-    while len(available) >= 2:
-        # Take the highest-ranked available player
-        player1 = available.pop(0)
-
-        # Find best opponent (highest rank that they haven't played)
-        opponent_idx = None
-        for idx, player2 in enumerate(available):
-            # Check if they've already played
-            if player2.player.player_id not in pairing_history.get(player1.player.player_id, set()):
-                opponent_idx = idx
-                break
-
-        if opponent_idx is None:
-            # No valid opponent in this bracket - needs pair-down
-            available.insert(0, player1)  # Put back for pair-down
-            break
+    played_masks = _played_masks(players, pairing_history)
+    pairs = _search_bracket_pairing(played_masks) if search else None
+    if pairs is None:
+        logger.debug(
+            f"Round {round_number}: No complete pairing for bracket of {len(players)}, "
+            f"falling back to greedy pair-downs"
+        )
+        pairs = _greedy_bracket_pairing(played_masks)
 
-        # Create the match
-        player2 = available.pop(opponent_idx)
+    matches: list[Match] = []
+    paired_indexes: set[int] = set()
+    for i, j in pairs:
         match = Match(
             id=uuid4(),
             tournament_id=component.tournament_id,
             component_id=component.id,
             round_id=round_id,
             round_number=round_number,
-            player1_id=player1.player.player_id,
-            player2_id=player2.player.player_id,
+            player1_id=players[i].player.player_id,
+            player2_id=players[j].player.player_id,
             table_number=table_offset + len(matches) + 1,
         )
         matches.append(match)
+        paired_indexes.update((i, j))
 
     # Any remaining players need to pair down
-    return matches, available
+    unpaired = [player for idx, player in enumerate(players) if idx not in paired_indexes]
+    return matches, unpaired
+
+
+def _played_masks(
+    players: list[StandingsEntry],
+    pairing_history: dict[UUID, set[UUID]],
+) -> list[int]:
+    """
+    Encode the bracket's pairing history as one bitset per player.
+
+    Players get dense indexes 0..N-1 in bracket order; bit j of played_masks[i]
+    is set iff players i and j have already played. Rematch checks then become
+    integer AND/shift operations instead of UUID set lookups.
+
+    Args:
+        players: Players in the bracket, in pairing order
+        pairing_history: Who has played whom
+
+    Returns:
+        List of bitsets, one per player in `players`
+    """
+    index_of = {entry.player.player_id: idx for idx, entry in enumerate(players)}
+    played_masks = []
+    for entry in players:
+        mask = 0
+        for opponent_id in pairing_history.get(entry.player.player_id, _EMPTY):
+            opponent_idx = index_of.get(opponent_id)
+            if opponent_idx is not None:
+                mask |= 1 << opponent_idx
+        played_masks.append(mask)
+    return played_masks
+
+
+def _greedy_bracket_pairing(played_masks: list[int]) -> list[tuple[int, int]]:
+    """
+    Greedily pair players top-down, stopping at the first player without an opponent.
+
+    Args:
+        played_masks: Per-player bitsets of bracket opponents already played
+
+    Returns:
+        List of (player1_index, player2_index) pairs, in bracket order
+    """
+    pairs: list[tuple[int, int]] = []
+    available = (1 << len(played_masks)) - 1
+
+    # Loop while at least two players are left
+    while available & (available - 1):
+        # Take the highest-ranked available player (lowest set bit)
+        i = (available & -available).bit_length() - 1
+        available &= ~(1 << i)
+
+        # Best opponent is the highest-ranked one they haven't played
+        candidates = available & ~played_masks[i]
+        if not candidates:
+            # No valid opponent in this bracket - remaining players pair down
+            break
+
+        j = (candidates & -candidates).bit_length() - 1
+        available &= ~(1 << j)
+        pairs.append((i, j))
+
+    return pairs
+
+
+def _search_bracket_pairing(played_masks: list[int]) -> list[tuple[int, int]] | None:
+    """
+    Search for a rematch-free pairing of the whole bracket.
+
+    Depth-first search in greedy preference order: the first solution found is
+    exactly the greedy pairing whenever greedy succeeds. For an odd bracket one
+    player is left over to pair down. Remaining players are tracked as a bitmask,
+    dead ends are memoized, and the search runs on an explicit stack (so large
+    brackets cannot hit the recursion limit); it gives up after
+    _BRACKET_SEARCH_LIMIT steps.
+
+    Args:
+        played_masks: Per-player bitsets of bracket opponents already played
+
+    Returns:
+        List of (player1_index, player2_index) pairs, or None if no complete
+        pairing was found
+    """
+    dead_ends: set[tuple[int, int]] = set()
+    # Open choices per search depth: [remaining, skips, player, untried candidates,
+    # skip still untried, current opponent bit (0 for the pair-down skip)]
+    stack: list[list[int]] = []
+    remaining = (1 << len(played_masks)) - 1
+    skips = len(played_masks) % 2
+    steps = 0
+
+    while True:
+        if not remaining:
+            return [(frame[2], frame[5].bit_length() - 1) for frame in stack if frame[5]]
+
+        steps += 1
+        if steps > _BRACKET_SEARCH_LIMIT:
+            return None
+
+        if (remaining, skips) not in dead_ends:
+            # Highest-ranked remaining player is the lowest set bit
+            i = (remaining & -remaining).bit_length() - 1
+            candidates = remaining & ~(1 << i) & ~played_masks[i]
+            stack.append([remaining, skips, i, candidates, int(skips > 0), 0])
+
+        # Advance the deepest open choice, backtracking past exhausted ones
+        while stack:
+            frame = stack[-1]
+            frame_remaining, frame_skips, i, candidates, can_skip, _ = frame
+            rest = frame_remaining & ~(1 << i)
+            if candidates:
+                # Try unplayed opponents from the highest-ranked down
+                lowest = candidates & -candidates
+                frame[3] = candidates ^ lowest
+                frame[5] = lowest
+                remaining, skips = rest & ~lowest, frame_skips
+                break
+            if can_skip:
+                # Leave this player for the pair-down if the bracket size allows one
+                frame[4] = 0
+                frame[5] = 0
+                remaining, skips = rest, frame_skips - 1
+                break
+            dead_ends.add((frame_remaining, frame_skips))
+            stack.pop()
+        else:
+            return None
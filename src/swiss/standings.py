@@ -8,6 +8,8 @@ AIA EAI Hin R Claude Code [Sonnet 4.5] v1.0
 """
 
 import logging
+import random
+from uuid import UUID
 
 from src.models.match import Match
 from src.models.tournament import TournamentRegistration
@@ -18,11 +20,8 @@ from .tiebreakers import (
     calculate_match_win_percentage,
     calculate_opponent_game_win_percentage,
     calculate_opponent_match_win_percentage,
-    get_game_result_for_player,
-    get_match_result_for_player,
-    get_opponent_id,
-    get_player_matches,
-    is_bye_match,
+    game_win_percentage,
+    match_win_percentage,
 )
 
 logger = logging.getLogger(__name__)
@@ -37,6 +36,17 @@ TIEBREAKER_CALCULATORS = {
 }
 
 
+def _average_over_opponent_idxs(
+    values_by_idx: list[float], opponent_idxs_by_idx: list[list[int]]
+) -> list[float]:
+    """Average of each player's opponents' values, or 0.0 for players without opponents."""
+    averages = [0.0] * len(opponent_idxs_by_idx)
+    for idx, opponent_idxs in enumerate(opponent_idxs_by_idx):
+        if opponent_idxs:
+            averages[idx] = sum([values_by_idx[o] for o in opponent_idxs]) / len(opponent_idxs)
+    return averages
+
+
 def calculate_standings(
     players: list[TournamentRegistration],
     matches: list[Match],
@@ -46,12 +56,14 @@ def calculate_standings(
     Calculate tournament standings for all players.
 
     Aggregates match results, calculates tiebreakers, sorts by match points
-    and configured tiebreaker chain, and assigns ranks.
+    and configured tiebreaker chain, and assigns ranks. Entries with identical
+    points and tiebreakers share a rank (competition ranking: 1, 2, 2, 4).
 
     Args:
         players: List of all tournament registrations
         matches: List of all matches played
         config: Configuration dict with "standings_tiebreakers" list
+            (default: ["omw", "gw", "ogw"])
 
     Returns:
         List of StandingsEntry objects sorted by rank (best to worst)
@@ -63,104 +75,184 @@ def calculate_standings(
 
     standings = []
 
+    # Configured chain, or the default OMW% -> GW% -> OGW%; also the sort/rank order
+    tiebreaker_names = tuple(config.get("standings_tiebreakers", ("omw", "gw", "ogw")))
+
+    # Sort keys are built alongside each entry
+    sort_keys: list[tuple[float, ...]] = []
+
+    # Aggregate every player's record in one pass over all matches, into parallel
+    # per-player counters indexed by a dense player index (same rules as
+    # get_match_result_for_player, get_game_result_for_player and get_opponent_id)
+    index_of: dict[UUID, int] = {}
     for player in players:
-        # Get all matches for this player
-        player_matches = get_player_matches(player, matches)
-
-        # Calculate match record
-        wins = 0
-        losses = 0
-        draws = 0
-        match_points = 0
-
-        for match in player_matches:
-            w, loss, d = get_match_result_for_player(player, match)
-            wins += w
-            losses += loss
-            draws += d
-
-        # Calculate match points (3 for win, 1 for draw, 0 for loss)
-        match_points = (wins * 3) + (draws * 1)
-
-        # Calculate game record
-        game_wins = 0
-        game_losses = 0
-        game_draws = 0
-
-        for match in player_matches:
-            gw, gl = get_game_result_for_player(player, match)
-            game_wins += gw
-            game_losses += gl
-            # Game draws not currently tracked separately in Match model
-
-        # Calculate metadata
-        matches_played = len(player_matches)
-        bye_count = sum(1 for match in player_matches if is_bye_match(match))
-
-        # Get list of opponents faced (excluding byes)
-        opponents_faced = []
-        for match in player_matches:
-            opponent_id = get_opponent_id(player, match)
-            if opponent_id is not None:
-                opponents_faced.append(str(opponent_id))
+        index_of.setdefault(player.player_id, len(index_of))
+    player_count = len(index_of)
+    wins_by_idx = [0] * player_count
+    losses_by_idx = [0] * player_count
+    draws_by_idx = [0] * player_count
+    game_wins_by_idx = [0] * player_count
+    game_losses_by_idx = [0] * player_count
+    byes_by_idx = [0] * player_count
+    matches_played_by_idx = [0] * player_count
+    opponents_by_idx: list[list[str]] = [[] for _ in range(player_count)]
+    # Registered opponents only, as dense indexes (for OMW%/OGW%)
+    opponent_idxs_by_idx: list[list[int]] = [[] for _ in range(player_count)]
+
+    # opponents_faced stores player_id strings; stringify each UUID only once
+    player_id_strs: dict[UUID, str] = {}
+
+    for match in matches:
+        idx1 = index_of.get(match.player1_id)
+        player2_id = match.player2_id
+        if player2_id is None:
+            # Bye counts as a match win with the configured game wins
+            if idx1 is not None:
+                wins_by_idx[idx1] += 1
+                game_wins_by_idx[idx1] += match.player1_wins
+                byes_by_idx[idx1] += 1
+                matches_played_by_idx[idx1] += 1
+            continue
+
+        idx2 = index_of.get(player2_id)
+        p1_wins = match.player1_wins
+        p2_wins = match.player2_wins
+
+        if idx1 is not None:
+            matches_played_by_idx[idx1] += 1
+            game_wins_by_idx[idx1] += p1_wins
+            game_losses_by_idx[idx1] += p2_wins
+            opponent_str = player_id_strs.get(player2_id)
+            if opponent_str is None:
+                player_id_strs[player2_id] = opponent_str = str(player2_id)
+            opponents_by_idx[idx1].append(opponent_str)
+            if idx2 is not None:
+                opponent_idxs_by_idx[idx1].append(idx2)
+
+        if idx2 is not None:
+            matches_played_by_idx[idx2] += 1
+            game_wins_by_idx[idx2] += p2_wins
+            game_losses_by_idx[idx2] += p1_wins
+            opponent_str = player_id_strs.get(match.player1_id)
+            if opponent_str is None:
+                player_id_strs[match.player1_id] = opponent_str = str(match.player1_id)
+            opponents_by_idx[idx2].append(opponent_str)
+            if idx1 is not None:
+                opponent_idxs_by_idx[idx2].append(idx1)
+
+        if p1_wins > p2_wins:
+            winner_idx, loser_idx = idx1, idx2
+        elif p1_wins < p2_wins:
+            winner_idx, loser_idx = idx2, idx1
+        else:
+            # Draw (equal wins)
+            if idx1 is not None:
+                draws_by_idx[idx1] += 1
+            if idx2 is not None:
+                draws_by_idx[idx2] += 1
+            continue
+
+        if winner_idx is not None:
+            wins_by_idx[winner_idx] += 1
+        if loser_idx is not None:
+            losses_by_idx[loser_idx] += 1
+
+    # First tiebreaker pass: every player's MW% and GW% straight from the aggregated
+    # counters
+    mw_by_idx = [0.0] * player_count
+    gw_by_idx = [0.0] * player_count
+    for idx in range(player_count):
+        mw_by_idx[idx] = match_win_percentage(
+            wins_by_idx[idx], draws_by_idx[idx], matches_played_by_idx[idx], config
+        )
+        gw_by_idx[idx] = game_win_percentage(game_wins_by_idx[idx], game_losses_by_idx[idx], config)
+
+    # Second pass: OMW%/OGW% average the opponents' values by index (same result as
+    # calculate_opponent_match_win_percentage / calculate_opponent_game_win_percentage)
+    values_by_idx = {"mw": mw_by_idx, "gw": gw_by_idx}
+    if "omw" in tiebreaker_names:
+        values_by_idx["omw"] = _average_over_opponent_idxs(mw_by_idx, opponent_idxs_by_idx)
+    if "ogw" in tiebreaker_names:
+        values_by_idx["ogw"] = _average_over_opponent_idxs(gw_by_idx, opponent_idxs_by_idx)
+
+    # Resolve the configured tiebreaker chain once:
+    # (name, precomputed values by index or None, registered calculator or None)
+    resolved_tiebreakers = [
+        (name, values_by_idx.get(name), TIEBREAKER_CALCULATORS.get(name))
+        for name in tiebreaker_names
+    ]
+
+    # Tiebreakers and sort keys per player position; entries are created after
+    # sorting, already carrying their final rank
+    tiebreakers_by_pos: list[dict[str, float]] = []
+
+    for player in players:
+        idx = index_of[player.player_id]
 
         # Calculate all configured tiebreakers
-        tiebreaker_names = config.get("standings_tiebreakers", ["omw", "gw", "ogw"])
         tiebreaker_values = {}
 
-        for tb_name in tiebreaker_names:
-            if tb_name == "random":
+        for tb_name, precomputed, calculator in resolved_tiebreakers:
+            if precomputed is not None:
+                tiebreaker_values[tb_name] = precomputed[idx]
+            elif calculator is not None:
+                # Registered calculator without a precomputed pass
+                tiebreaker_values[tb_name] = calculator(player, matches, players, config)
+            elif tb_name == "random":
                 # Random tiebreaker - just use a random value
-                import random
-
                 tiebreaker_values[tb_name] = random.random()  # noqa: S311
-            elif tb_name in TIEBREAKER_CALCULATORS:
-                calculator = TIEBREAKER_CALCULATORS[tb_name]
-                tiebreaker_values[tb_name] = calculator(player, matches, players, config)
             else:
                 # Unknown tiebreaker - skip it
                 tiebreaker_values[tb_name] = 0.0
 
-        # Create standings entry
-        entry = StandingsEntry(
-            player=player,
-            rank=0,  # Will be assigned after sorting
-            wins=wins,
-            losses=losses,
-            draws=draws,
-            match_points=match_points,
-            game_wins=game_wins,
-            game_losses=game_losses,
-            game_draws=game_draws,
-            tiebreakers=tiebreaker_values,
-            matches_played=matches_played,
-            bye_count=bye_count,
-            opponents_faced=opponents_faced,
+        tiebreakers_by_pos.append(tiebreaker_values)
+        # Match points: 3 for win, 1 for draw, 0 for loss
+        sort_keys.append(
+            (
+                wins_by_idx[idx] * 3 + draws_by_idx[idx],
+                *(tiebreaker_values[tb] for tb in tiebreaker_names),
+            )
         )
 
-        standings.append(entry)
-
     # Sort standings
     # Primary: Match points (descending)
-    # Secondary: Tiebreakers in configured order (descending)
-    def sort_key(entry: StandingsEntry) -> tuple[float, ...]:
-        # Start with match points (convert to float for consistent type)
-        key: list[float] = [float(entry.match_points)]
-
-        # Add each tiebreaker value in order
-        for tb_name in config.get("standings_tiebreakers", []):
-            if tb_name in entry.tiebreakers:
-                key.append(entry.tiebreakers[tb_name])
-            else:
-                key.append(0.0)  # Missing tiebreaker = 0
-
-        return tuple(key)
-
-    standings.sort(key=sort_key, reverse=True)
-
-    # Assign ranks
-    for rank, entry in enumerate(standings, start=1):
-        entry.rank = rank
+    # Secondary: Tiebreakers in configured (or default) order (descending)
+    # Positions are sorted by their prebuilt key (stable, so fully tied entries
+    # keep their input order)
+    order = sorted(range(len(players)), key=sort_keys.__getitem__, reverse=True)
+
+    # Competition ranking: entries with identical sort keys share a rank, and the
+    # next distinct key takes its 1-based position ("1, 2, 2, 4")
+    rank = 0
+    previous_key = None
+    for position, pos in enumerate(order, start=1):
+        key = sort_keys[pos]
+        if key != previous_key:
+            rank = position
+            previous_key = key
+
+        player = players[pos]
+        idx = index_of[player.player_id]
+        wins = wins_by_idx[idx]
+        draws = draws_by_idx[idx]
+
+        standings.append(
+            StandingsEntry(
+                player=player,
+                rank=rank,
+                wins=wins,
+                losses=losses_by_idx[idx],
+                draws=draws,
+                match_points=(wins * 3) + (draws * 1),
+                game_wins=game_wins_by_idx[idx],
+                game_losses=game_losses_by_idx[idx],
+                game_draws=0,  # Game draws not currently tracked separately in Match model
+                tiebreakers=tiebreakers_by_pos[pos],
+                matches_played=matches_played_by_idx[idx],
+                bye_count=byes_by_idx[idx],
+                opponents_faced=opponents_by_idx[idx],
+            )
+        )
 
     if standings:
         logger.info(
@@ -79,6 +79,48 @@ def get_opponent_id(player: TournamentRegistration, match: Match) -> UUID | None
     return match.player1_id
 
 
+def match_win_percentage(wins: int, draws: int, matches_played: int, config: dict) -> float:
+    """
+    MW% from an already aggregated match record (see calculate_match_win_percentage).
+
+    Args:
+        wins: Match wins (byes included)
+        draws: Match draws
+        matches_played: Total matches, byes included
+        config: Configuration dict with optional "mw_floor" (default 0.33)
+
+    Returns:
+        Match win percentage (0.0 to 1.0), 0.0 if no matches were played
+    """
+    if not matches_played:
+        return 0.0
+
+    # Draws count as 0.5 wins; apply floor
+    floor: float = float(config.get("mw_floor", 0.33))
+    return max((wins + draws * 0.5) / matches_played, floor)
+
+
+def game_win_percentage(game_wins: int, game_losses: int, config: dict) -> float:
+    """
+    GW% from an already aggregated game record (see calculate_game_win_percentage).
+
+    Args:
+        game_wins: Game wins (bye games included)
+        game_losses: Game losses
+        config: Configuration dict with optional "gw_floor" (default 0.33)
+
+    Returns:
+        Game win percentage (0.0 to 1.0), 0.0 if no games were recorded
+    """
+    total_games = game_wins + game_losses
+    if total_games == 0:
+        return 0.0
+
+    # Apply floor
+    floor: float = float(config.get("gw_floor", 0.33))
+    return max(game_wins / total_games, floor)
+
+
 def calculate_match_win_percentage(
     player: TournamentRegistration,
     matches: list[Match],
@@ -102,21 +144,15 @@ def calculate_match_win_percentage(
     """
     player_matches = get_player_matches(player, matches)
 
-    if not player_matches:
-        return 0.0
-
-    total_wins = 0.0
-    total_matches = len(player_matches)
+    total_wins = 0
+    total_draws = 0
 
     for match in player_matches:
         wins, losses, draws = get_match_result_for_player(player, match)
-        total_wins += wins + (draws * 0.5)  # Draws count as 0.5 wins
+        total_wins += wins
+        total_draws += draws
 
-    mw_pct = total_wins / total_matches
-
-    # Apply floor
-    floor: float = float(config.get("mw_floor", 0.33))
-    return max(mw_pct, floor)
+    return match_win_percentage(total_wins, total_draws, len(player_matches), config)
 
 
 def calculate_game_win_percentage(
@@ -143,9 +179,6 @@ def calculate_game_win_percentage(
     """
     player_matches = get_player_matches(player, matches)
 
-    if not player_matches:
-        return 0.0
-
     total_game_wins = 0
     total_game_losses = 0
 
@@ -154,16 +187,7 @@ def calculate_game_win_percentage(
         total_game_wins += game_wins
         total_game_losses += game_losses
 
-    total_games = total_game_wins + total_game_losses
-
-    if total_games == 0:
-        return 0.0
-
-    gw_pct = total_game_wins / total_games
-
-    # Apply floor
-    floor: float = float(config.get("gw_floor", 0.33))
-    return max(gw_pct, floor)
+    return game_win_percentage(total_game_wins, total_game_losses, config)
 
 
 def calculate_opponent_match_win_percentage(
@@ -200,12 +224,15 @@ def calculate_opponent_match_win_percentage(
     if not opponent_ids:
         return 0.0  # No opponents (only byes)
 
+    # Index registrations once so each opponent lookup is O(1) instead of a list scan
+    registrations_by_id = {reg.player_id: reg for reg in all_registrations}
+
     # Calculate each opponent's MW%
     opponent_mw_pcts = []
 
     for opponent_id in opponent_ids:
         # Find opponent registration
-        opponent = next((reg for reg in all_registrations if reg.player_id == opponent_id), None)
+        opponent = registrations_by_id.get(opponent_id)
 
         if opponent is None:
             continue  # Skip if opponent not found
@@ -255,12 +282,15 @@ def calculate_opponent_game_win_percentage(
     if not opponent_ids:
         return 0.0  # No opponents (only byes)
 
+    # Index registrations once so each opponent lookup is O(1) instead of a list scan
+    registrations_by_id = {reg.player_id: reg for reg in all_registrations}
+
     # Calculate each opponent's GW%
     opponent_gw_pcts = []
 
     for opponent_id in opponent_ids:
         # Find opponent registration
-        opponent = next((reg for reg in all_registrations if reg.player_id == opponent_id), None)
+        opponent = registrations_by_id.get(opponent_id)
 
         if opponent is None:
             continue  # Skip if opponent not found
@@ -141,6 +141,9 @@ class TestRoundAdvancement:
         assert round2.start_time is not None
         assert round2.end_time is None
 
+        # The next round starts exactly when this one ended
+        assert round2.start_time == round1.end_time
+
     def test_advance_stops_at_max_rounds(self):
         """
         SCENARIO: Tournament has max_rounds=3, currently on Round 3
@@ -7,7 +7,9 @@ This module defines comprehensive test cases for Swiss tournament pairing,
 including edge cases, bye handling, and pairing constraints.
 """
 
+import os
 import random
+from collections import Counter
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
@@ -24,7 +26,13 @@ from src.models.base import (
 from src.models.match import Component, Match, Round
 from src.models.player import Player
 from src.models.tournament import RegistrationControl, Tournament, TournamentRegistration
-from src.swiss import calculate_standings, pair_round, pair_round_1
+from src.swiss import (
+    StandingsEntry,
+    calculate_standings,
+    pair_round,
+    pair_round_1,
+    update_pairing_history,
+)
 
 # =============================================================================
 # Test Fixtures and Helpers
@@ -74,15 +82,22 @@ def base_tournament_data():
     }
 
 
+def batch_uuids(count: int) -> list[UUID]:
+    """Create `count` random version 4 UUIDs from a single os.urandom() call."""
+    raw = os.urandom(16 * count)
+    return [UUID(bytes=raw[16 * i : 16 * (i + 1)], version=4) for i in range(count)]
+
+
 def create_test_players(count: int) -> list[Player]:
     """Create test players."""
+    now = datetime.now(timezone.utc)
     return [
         Player(
-            id=uuid4(),
+            id=player_id,
             name=f"Player {i + 1}",
-            created_at=datetime.now(timezone.utc),
+            created_at=now,
         )
-        for i in range(count)
+        for i, player_id in enumerate(batch_uuids(count))
     ]
 
 
@@ -90,16 +105,19 @@ def create_registrations(
     tournament_id: UUID, players: list[Player]
 ) -> list[TournamentRegistration]:
     """Create tournament registrations for players."""
+    now = datetime.now(timezone.utc)
     return [
         TournamentRegistration(
-            id=uuid4(),
+            id=registration_id,
             tournament_id=tournament_id,
             player_id=player.id,
             sequence_id=i + 1,
             status=PlayerStatus.ACTIVE,
-            registration_time=datetime.now(timezone.utc),
+            registration_time=now,
+        )
+        for i, (player, registration_id) in enumerate(
+            zip(players, batch_uuids(len(players)), strict=True)
         )
-        for i, player in enumerate(players)
     ]
 
 
@@ -355,6 +373,76 @@ class TestSubsequentRoundPairing:
         """
         pytest.skip("Pairing algorithm not yet implemented")
 
+    def test_bracket_repaired_when_greedy_strands_players(self, base_tournament_data):
+        """
+        SCENARIO: 4-player bracket where P3 and P4 have already played each other
+          - Greedy top-down pairing would take P1 vs P2 and strand P3/P4
+        EXPECTED:
+          - Bracket is still fully paired without rematches (P1 vs P3, P2 vs P4)
+          - Nobody pairs down
+        """
+        from src.swiss.pairing import _pair_bracket
+
+        players = create_test_players(4)
+        registrations = create_registrations(base_tournament_data["tournament_id"], players)
+        bracket = [StandingsEntry(player=reg, rank=i + 1) for i, reg in enumerate(registrations)]
+        p1, p2, p3, p4 = (reg.player_id for reg in registrations)
+        pairing_history = {p3: {p4}, p4: {p3}}
+
+        matches, unpaired = _pair_bracket(
+            bracket, pairing_history, base_tournament_data["component"], uuid4(), 2, 0
+        )
+
+        assert unpaired == []
+        assert [(m.player1_id, m.player2_id) for m in matches] == [(p1, p3), (p2, p4)]
+        assert [m.table_number for m in matches] == [1, 2]
+
+    def test_bracket_search_keeps_lower_brackets_pairable(self, base_tournament_data):
+        """
+        SCENARIO: 6 players, round 3
+        STANDINGS after R2:
+          - P4, P6: 4 points (played each other)
+          - P3, P5: 3 points
+          - P1, P2: 1 point (played each other)
+        HISTORY: P4-P6, P3-P1, P5-P2 (R1); P3-P4, P5-P6, P1-P2 (R2)
+
+        EXPECTED:
+          - Pairing the 3-point bracket with P4/P6 completely (P3-P6, P5-P4)
+            would strand P1/P2, so the greedy cascade is used instead
+          - P3 vs P5, P1 vs P4, P2 vs P6 (no rematches)
+        """
+        tournament_id = base_tournament_data["tournament_id"]
+        component_id = base_tournament_data["component_id"]
+        players = create_test_players(6)
+        registrations = create_registrations(tournament_id, players)
+        p1, p2, p3, p4, p5, p6 = (reg.player_id for reg in registrations)
+
+        round1_id, round2_id = uuid4(), uuid4()
+        previous_matches = [
+            # Round 1
+            create_match(tournament_id, component_id, round1_id, 1, p4, p6, 1, 1),
+            create_match(tournament_id, component_id, round1_id, 1, p3, p1, 2, 0),
+            create_match(tournament_id, component_id, round1_id, 1, p5, p2, 2, 0),
+            # Round 2
+            create_match(tournament_id, component_id, round2_id, 2, p4, p3, 2, 0),
+            create_match(tournament_id, component_id, round2_id, 2, p6, p5, 2, 0),
+            create_match(tournament_id, component_id, round2_id, 2, p1, p2, 1, 1),
+        ]
+
+        round3_pairings = pair_round(
+            registrations,
+            previous_matches,
+            base_tournament_data["component"],
+            {},
+            round_number=3,
+        )
+
+        assert {frozenset((m.player1_id, m.player2_id)) for m in round3_pairings} == {
+            frozenset((p3, p5)),
+            frozenset((p1, p4)),
+            frozenset((p2, p6)),
+        }
+
 
 # =============================================================================
 # Test Case 3: Bye Handling
@@ -364,9 +452,12 @@ class TestSubsequentRoundPairing:
 class TestByeHandling:
     """Test bye assignment and handling."""
 
-    def test_bye_lowest_ranked_player(self, base_tournament_data):
+    @pytest.mark.parametrize("precomputed", [False, True], ids=["calculated", "precomputed"])
+    def test_bye_lowest_ranked_player(self, base_tournament_data, precomputed):
         """
-        SCENARIO: 7 players, round 2
+        SCENARIO: 7 players, round 2; pair_round either filters and calculates the
+          standings itself or gets the active players' standings from the caller
+          (precomputed_standings + active_only)
         STANDINGS after R1:
           - 6 players with 3 points (all won)
           - 1 player with 0 points (lost)
@@ -393,24 +484,35 @@ class TestByeHandling:
         # This ensures we have 3 winners and 4 losers
         registrations[0].status = PlayerStatus.DROPPED
 
-        # Pair round 2 with 7 active players (3 winners, 4 losers)
+        # Calculate standings to determine who should get the bye
         config = {"standings_tiebreakers": ["omw", "gw", "ogw"]}
-        round2_pairings = pair_round(
-            registrations,
-            round1_pairings,
-            base_tournament_data["component"],
-            config,
-            round_number=2,
-        )
+        active_regs = [r for r in registrations if r.status == PlayerStatus.ACTIVE]
+        standings = calculate_standings(active_regs, round1_pairings, config)
+
+        # Pair round 2 with 7 active players (3 winners, 4 losers)
+        if precomputed:
+            round2_pairings = pair_round(
+                active_regs,
+                round1_pairings,
+                base_tournament_data["component"],
+                config,
+                round_number=2,
+                precomputed_standings=standings,
+                active_only=True,
+            )
+        else:
+            round2_pairings = pair_round(
+                registrations,
+                round1_pairings,
+                base_tournament_data["component"],
+                config,
+                round_number=2,
+            )
 
         # Find the bye
         bye_matches = [m for m in round2_pairings if m.player2_id is None]
         assert len(bye_matches) == 1
 
-        # Calculate standings to determine who should get the bye
-        active_regs = [r for r in registrations if r.status == PlayerStatus.ACTIVE]
-        standings = calculate_standings(active_regs, round1_pairings, config)
-
         # The bye should go to the lowest-ranked player (last in standings)
         lowest_ranked = standings[-1]
         bye_match = bye_matches[0]
@@ -423,9 +525,11 @@ class TestByeHandling:
         # Verify bye went to a 0-point player
         assert lowest_ranked.match_points == 0, "Lowest-ranked should have 0 points"
 
-    def test_bye_rotation_no_duplicates(self, base_tournament_data):
+    @pytest.mark.parametrize("maintain_history", [False, True], ids=["rebuilt", "maintained"])
+    def test_bye_rotation_no_duplicates(self, base_tournament_data, maintain_history):
         """
-        SCENARIO: 5 players, 4 rounds
+        SCENARIO: 5 players, 4 rounds; the pairing history is either rebuilt by
+          pair_round each round or maintained by the caller (update_pairing_history)
         EXPECTED:
           - Each player gets exactly 1 bye over 4 rounds
           - OR: If impossible, minimize duplicate byes
@@ -449,6 +553,9 @@ class TestByeHandling:
                 bye_recipients.append(match.player1_id)
         all_matches.extend(round1_pairings)
 
+        # Optionally keep one pairing history, extended with each round's results
+        pairing_history = update_pairing_history({}, round1_pairings) if maintain_history else None
+
         # Rounds 2-4
         for round_num in range(2, 5):
             round_pairings = pair_round(
@@ -457,6 +564,7 @@ class TestByeHandling:
                 base_tournament_data["component"],
                 config,
                 round_number=round_num,
+                pairing_history=pairing_history,
             )
             for match in round_pairings:
                 match.player1_wins = 2
@@ -464,17 +572,19 @@ class TestByeHandling:
                 if match.player2_id is None:
                     bye_recipients.append(match.player1_id)
             all_matches.extend(round_pairings)
+            if pairing_history is not None:
+                update_pairing_history(pairing_history, round_pairings)
 
         # Verify: Each player should get at most 1 bye (ideally exactly 1)
-        player_ids = [p.id for p in players]
-        bye_counts = {pid: bye_recipients.count(pid) for pid in player_ids}
+        bye_counts = Counter(bye_recipients)
+        assert set(bye_counts) <= {p.id for p in players}
 
         # All players should have received exactly 1 bye (5 players, 4 rounds, 1 bye per round)
         for player_id, bye_count in bye_counts.items():
             assert bye_count <= 1, f"Player {player_id} got {bye_count} byes, should be <= 1"
 
         # At least 4 players should have gotten a bye (one per round)
-        players_with_byes = sum(1 for count in bye_counts.values() if count > 0)
+        players_with_byes = len(bye_counts)
         assert players_with_byes >= 4, f"Only {players_with_byes}/5 players got byes"
 
     def test_bye_match_structure(self, base_tournament_data):
@@ -1356,3 +1466,70 @@ class TestFullTournamentPairing:
         dropped_count = sum(1 for s in final_standings if s.player.status.value == "dropped")
         assert active_count == 8, "Should have 8 active players"
         assert dropped_count == 1, "Should have 1 dropped player"
+
+    def test_incrementally_maintained_pairing_history(self, base_tournament_data):
+        """
+        SCENARIO: 8 players, 3 rounds, caller keeps one pairing history across rounds
+        EXPECTED:
+          - Pairings match those built from the full match list each round
+          - No rematches in any round
+        """
+        players = create_test_players(8)
+        registrations = create_registrations(base_tournament_data["tournament_id"], players)
+        component = base_tournament_data["component"]
+        config = {"standings_tiebreakers": ["omw", "gw", "ogw"]}
+
+        round1 = pair_round_1(registrations, component)
+        for i, match in enumerate(round1):
+            match.player1_wins = 2 if i % 2 == 0 else 0
+            match.player2_wins = 0 if i % 2 == 0 else 2
+        all_matches = list(round1)
+        pairing_history = update_pairing_history({}, round1)
+
+        for round_number in (2, 3):
+            rebuilt = pair_round(registrations, all_matches, component, config, round_number)
+            maintained = pair_round(
+                registrations,
+                all_matches,
+                component,
+                config,
+                round_number,
+                pairing_history=pairing_history,
+            )
+            assert [(m.player1_id, m.player2_id) for m in maintained] == [
+                (m.player1_id, m.player2_id) for m in rebuilt
+            ]
+            for match in maintained:
+                assert match.player2_id not in pairing_history.get(match.player1_id, set())
+                match.player1_wins = 2
+                match.player2_wins = 1
+
+            all_matches.extend(maintained)
+            update_pairing_history(pairing_history, maintained)
+
+        assert all(len(opponents) == 3 for opponents in pairing_history.values())
+
+    def test_pairing_with_precomputed_standings(self, base_tournament_data):
+        """
+        SCENARIO: Caller computes round 2 standings once and passes them to pair_round
+        EXPECTED: Same pairings as letting pair_round calculate the standings itself
+        """
+        players = create_test_players(6)
+        registrations = create_registrations(base_tournament_data["tournament_id"], players)
+        component = base_tournament_data["component"]
+        config = {"standings_tiebreakers": ["omw", "gw", "ogw"]}
+
+        round1 = pair_round_1(registrations, component, mode="seeded")
+        for match in round1:
+            match.player1_wins = 2
+            match.player2_wins = 1
+
+        standings = calculate_standings(registrations, round1, config)
+        precomputed = pair_round(
+            registrations, round1, component, config, 2, precomputed_standings=standings
+        )
+        calculated = pair_round(registrations, round1, component, config, 2)
+
+        assert [(m.player1_id, m.player2_id) for m in precomputed] == [
+            (m.player1_id, m.player2_id) for m in calculated
+        ]
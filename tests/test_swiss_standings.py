@@ -7,22 +7,44 @@ final standings sort order.
 AIA EAI Hin R Claude Code [Sonnet 4.5] v1.0
 """
 
-from uuid import uuid4
+import itertools
+from uuid import UUID
 
 import pytest
 
 from src.models.base import PlayerStatus
 from src.models.match import Match
 from src.models.tournament import TournamentRegistration
-from src.swiss.standings import calculate_standings
+from src.swiss.standings import TIEBREAKER_CALCULATORS, calculate_standings
 
+# Deterministic IDs: unique within the module, no os.urandom() per ID, and
+# stable between runs of the module when comparing failures
+_uid_counter = itertools.count(1)
 
-@pytest.fixture
+
+def _uid() -> UUID:
+    """Return the next sequential test UUID."""
+    return UUID(int=next(_uid_counter))
+
+
+# Tiebreaker configurations shared by the tests (calculate_standings only reads them)
+CONFIG_OMW_GW_OGW_RANDOM = {"standings_tiebreakers": ("omw", "gw", "ogw", "random")}
+CONFIG_OMW_GW_OGW_RANDOM_FLOORED = {
+    "standings_tiebreakers": ("omw", "gw", "ogw", "random"),
+    "omw_floor": 0.33,
+    "gw_floor": 0.33,
+}
+CONFIG_OMW_GW_RANDOM = {"standings_tiebreakers": ("omw", "gw", "random")}
+CONFIG_GW_OMW_RANDOM = {"standings_tiebreakers": ("gw", "omw", "random")}
+CONFIG_MATCH_POINTS_ONLY = {"standings_tiebreakers": ()}
+
+
+@pytest.fixture(scope="module")
 def base_tournament_data():
-    """Create basic tournament data for testing."""
-    tournament_id = uuid4()
-    component_id = uuid4()
-    round_id = uuid4()
+    """Create basic tournament data for testing (shared by the whole module)."""
+    tournament_id = _uid()
+    component_id = _uid()
+    round_id = _uid()
 
     return {
         "tournament_id": tournament_id,
@@ -31,25 +53,55 @@ def base_tournament_data():
     }
 
 
-# ===== Basic Standings Tests =====
+@pytest.fixture(scope="module")
+def make_player(base_tournament_data):
+    """Factory for registrations in the module's tournament; each call is a new player."""
+    tournament_id = base_tournament_data["tournament_id"]
 
+    def _make_player(sequence_id, status=PlayerStatus.ACTIVE):
+        return TournamentRegistration(
+            id=_uid(),
+            tournament_id=tournament_id,
+            player_id=_uid(),
+            sequence_id=sequence_id,
+            status=status,
+        )
 
-def test_standings_no_matches(base_tournament_data):
-    """Test standings calculation with no matches played."""
-    players = [
-        TournamentRegistration(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            player_id=uuid4(),
-            sequence_id=i + 1,
-            status=PlayerStatus.ACTIVE,
+    return _make_player
+
+
+@pytest.fixture(scope="module")
+def make_match(base_tournament_data):
+    """Factory for matches in the module's tournament; only the result varies per call."""
+    tournament_id = base_tournament_data["tournament_id"]
+    component_id = base_tournament_data["component_id"]
+    round_id = base_tournament_data["round_id"]
+
+    def _make_match(round_number, player1_id, player2_id, player1_wins, player2_wins, draws=0):
+        return Match(
+            id=_uid(),
+            tournament_id=tournament_id,
+            component_id=component_id,
+            round_id=round_id,
+            round_number=round_number,
+            player1_id=player1_id,
+            player2_id=player2_id,  # None for a bye
+            player1_wins=player1_wins,
+            player2_wins=player2_wins,
+            draws=draws,
         )
-        for i in range(4)
-    ]
 
-    config = {"standings_tiebreakers": ["omw", "gw", "ogw", "random"]}
+    return _make_match
+
+
+# ===== Basic Standings Tests =====
 
-    standings = calculate_standings(players, [], config)
+
+def test_standings_no_matches(make_player):
+    """Test standings calculation with no matches played."""
+    players = [make_player(i + 1) for i in range(4)]
+
+    standings = calculate_standings(players, [], CONFIG_OMW_GW_OGW_RANDOM)
 
     # All players should have 0-0-0 records
     assert len(standings) == 4
@@ -65,96 +117,30 @@ def test_standings_no_matches(base_tournament_data):
     assert sorted(ranks) == [1, 2, 3, 4]
 
 
-def test_standings_simple_tournament(base_tournament_data):
+def test_standings_simple_tournament(make_player, make_match):
     """Test standings for a simple 4-player tournament."""
     # Player A: 2-0 (6 points)
     # Player B: 1-1 (3 points)
     # Player C: 1-1 (3 points)
     # Player D: 0-2 (0 points)
 
-    player_a = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=1,
-        status=PlayerStatus.ACTIVE,
-    )
-    player_b = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=2,
-        status=PlayerStatus.ACTIVE,
-    )
-    player_c = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=3,
-        status=PlayerStatus.ACTIVE,
-    )
-    player_d = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=4,
-        status=PlayerStatus.ACTIVE,
-    )
+    player_a = make_player(1)
+    player_b = make_player(2)
+    player_c = make_player(3)
+    player_d = make_player(4)
 
     players = [player_a, player_b, player_c, player_d]
 
     matches = [
         # Round 1: A beats B, C beats D
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=base_tournament_data["round_id"],
-            round_number=1,
-            player1_id=player_a.player_id,
-            player2_id=player_b.player_id,
-            player1_wins=2,
-            player2_wins=0,
-        ),
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=base_tournament_data["round_id"],
-            round_number=1,
-            player1_id=player_c.player_id,
-            player2_id=player_d.player_id,
-            player1_wins=2,
-            player2_wins=0,
-        ),
+        make_match(1, player_a.player_id, player_b.player_id, 2, 0),
+        make_match(1, player_c.player_id, player_d.player_id, 2, 0),
         # Round 2: A beats C, B beats D
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=base_tournament_data["round_id"],
-            round_number=2,
-            player1_id=player_a.player_id,
-            player2_id=player_c.player_id,
-            player1_wins=2,
-            player2_wins=0,
-        ),
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=base_tournament_data["round_id"],
-            round_number=2,
-            player1_id=player_b.player_id,
-            player2_id=player_d.player_id,
-            player1_wins=2,
-            player2_wins=0,
-        ),
+        make_match(2, player_a.player_id, player_c.player_id, 2, 0),
+        make_match(2, player_b.player_id, player_d.player_id, 2, 0),
     ]
 
-    config = {"standings_tiebreakers": ["omw", "gw", "ogw", "random"]}
-
-    standings = calculate_standings(players, matches, config)
+    standings = calculate_standings(players, matches, CONFIG_OMW_GW_OGW_RANDOM)
 
     # Verify standings order by match points
     assert standings[0].player.player_id == player_a.player_id  # 2-0 = 6 points (rank 1)
@@ -176,44 +162,19 @@ def test_standings_simple_tournament(base_tournament_data):
     assert standings[3].rank == 4
 
 
-def test_standings_with_draws(base_tournament_data):
+def test_standings_with_draws(make_player, make_match):
     """Test standings calculation with drawn matches."""
-    player_a = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=1,
-        status=PlayerStatus.ACTIVE,
-    )
-    player_b = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=2,
-        status=PlayerStatus.ACTIVE,
-    )
+    player_a = make_player(1)
+    player_b = make_player(2)
 
     players = [player_a, player_b]
 
     matches = [
         # Draw (1-1-1 in games)
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=base_tournament_data["round_id"],
-            round_number=1,
-            player1_id=player_a.player_id,
-            player2_id=player_b.player_id,
-            player1_wins=1,
-            player2_wins=1,
-            draws=1,
-        ),
+        make_match(1, player_a.player_id, player_b.player_id, 1, 1, draws=1),
     ]
 
-    config = {"standings_tiebreakers": ["omw", "gw", "random"]}
-
-    standings = calculate_standings(players, matches, config)
+    standings = calculate_standings(players, matches, CONFIG_OMW_GW_RANDOM)
 
     # Both players should have 0-0-1 records with 1 match point
     assert len(standings) == 2
@@ -224,55 +185,21 @@ def test_standings_with_draws(base_tournament_data):
         assert entry.match_points == 1  # 1 point for draw
 
 
-def test_standings_with_bye(base_tournament_data):
+def test_standings_with_bye(make_player, make_match):
     """Test that byes are counted correctly in standings."""
-    player_a = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=1,
-        status=PlayerStatus.ACTIVE,
-    )
-    player_b = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=2,
-        status=PlayerStatus.ACTIVE,
-    )
+    player_a = make_player(1)
+    player_b = make_player(2)
 
     players = [player_a, player_b]
 
     matches = [
         # A gets bye
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=base_tournament_data["round_id"],
-            round_number=1,
-            player1_id=player_a.player_id,
-            player2_id=None,  # Bye
-            player1_wins=2,
-            player2_wins=0,
-        ),
+        make_match(1, player_a.player_id, None, 2, 0),  # Bye
         # B gets bye
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=base_tournament_data["round_id"],
-            round_number=2,
-            player1_id=player_b.player_id,
-            player2_id=None,  # Bye
-            player1_wins=2,
-            player2_wins=0,
-        ),
+        make_match(2, player_b.player_id, None, 2, 0),  # Bye
     ]
 
-    config = {"standings_tiebreakers": ["omw", "gw", "random"]}
-
-    standings = calculate_standings(players, matches, config)
+    standings = calculate_standings(players, matches, CONFIG_OMW_GW_RANDOM)
 
     # Both should have 1 win from bye
     for entry in standings:
@@ -284,122 +211,33 @@ def test_standings_with_bye(base_tournament_data):
 # ===== Tiebreaker Sorting Tests =====
 
 
-def test_standings_tiebreaker_omw_primary(base_tournament_data):
+def test_standings_tiebreaker_omw_primary(make_player, make_match):
     """Test that OMW% is used as primary tiebreaker."""
     # Create scenario where match points are tied but OMW% differs
     # Player A: 2-1, beat weak opponents (low OMW%)
     # Player B: 2-1, beat strong opponents (high OMW%)
 
-    player_a = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=1,
-        status=PlayerStatus.ACTIVE,
-    )
-    player_b = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=2,
-        status=PlayerStatus.ACTIVE,
-    )
-    player_c = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=3,
-        status=PlayerStatus.ACTIVE,
-    )
-    player_d = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=4,
-        status=PlayerStatus.ACTIVE,
-    )
+    player_a = make_player(1)
+    player_b = make_player(2)
+    player_c = make_player(3)
+    player_d = make_player(4)
 
     players = [player_a, player_b, player_c, player_d]
 
     matches = [
         # Round 1: A beats C (weak), B beats D (weak)
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=uuid4(),
-            round_number=1,
-            player1_id=player_a.player_id,
-            player2_id=player_c.player_id,
-            player1_wins=2,
-            player2_wins=0,
-        ),
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=uuid4(),
-            round_number=1,
-            player1_id=player_b.player_id,
-            player2_id=player_d.player_id,
-            player1_wins=2,
-            player2_wins=0,
-        ),
+        make_match(1, player_a.player_id, player_c.player_id, 2, 0),
+        make_match(1, player_b.player_id, player_d.player_id, 2, 0),
         # Round 2: A beats D (still weak), B beats C (still weak)
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=uuid4(),
-            round_number=2,
-            player1_id=player_a.player_id,
-            player2_id=player_d.player_id,
-            player1_wins=2,
-            player2_wins=0,
-        ),
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=uuid4(),
-            round_number=2,
-            player1_id=player_b.player_id,
-            player2_id=player_c.player_id,
-            player1_wins=2,
-            player2_wins=0,
-        ),
+        make_match(2, player_a.player_id, player_d.player_id, 2, 0),
+        make_match(2, player_b.player_id, player_c.player_id, 2, 0),
         # Round 3: C beats A, D beats B (upsets!)
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=uuid4(),
-            round_number=3,
-            player1_id=player_c.player_id,
-            player2_id=player_a.player_id,
-            player1_wins=2,
-            player2_wins=0,
-        ),
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=uuid4(),
-            round_number=3,
-            player1_id=player_d.player_id,
-            player2_id=player_b.player_id,
-            player1_wins=2,
-            player2_wins=0,
-        ),
+        make_match(3, player_c.player_id, player_a.player_id, 2, 0),
+        make_match(3, player_d.player_id, player_b.player_id, 2, 0),
     ]
 
-    config = {
-        "standings_tiebreakers": ["omw", "gw", "ogw", "random"],
-        "omw_floor": 0.33,
-        "gw_floor": 0.33,
-    }
-
-    standings = calculate_standings(players, matches, config)
+    standings = calculate_standings(players, matches, CONFIG_OMW_GW_OGW_RANDOM_FLOORED)
+    by_id = {s.player.player_id: s for s in standings}
 
     # A and B both 2-1 (6 points)
     # B beat C and D who both went 1-2 (better opponents)
@@ -407,8 +245,8 @@ def test_standings_tiebreaker_omw_primary(base_tournament_data):
     # Actually they have same opponents... let me reconsider this test
 
     # Both A and B are 2-1 with 6 points
-    a_standing = next(s for s in standings if s.player.player_id == player_a.player_id)
-    b_standing = next(s for s in standings if s.player.player_id == player_b.player_id)
+    a_standing = by_id[player_a.player_id]
+    b_standing = by_id[player_b.player_id]
 
     assert a_standing.match_points == 6
     assert b_standing.match_points == 6
@@ -418,45 +256,21 @@ def test_standings_tiebreaker_omw_primary(base_tournament_data):
     assert "omw" in b_standing.tiebreakers
 
 
-def test_standings_different_tiebreaker_config(base_tournament_data):
+def test_standings_different_tiebreaker_config(make_player, make_match):
     """Test standings with different tiebreaker configuration."""
     # Same tournament, different tiebreaker order should potentially change rankings
 
-    player_a = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=1,
-        status=PlayerStatus.ACTIVE,
-    )
-    player_b = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=2,
-        status=PlayerStatus.ACTIVE,
-    )
+    player_a = make_player(1)
+    player_b = make_player(2)
 
     players = [player_a, player_b]
 
     matches = [
         # One match: A wins 2-1 (close match)
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=base_tournament_data["round_id"],
-            round_number=1,
-            player1_id=player_a.player_id,
-            player2_id=player_b.player_id,
-            player1_wins=2,
-            player2_wins=1,
-        ),
+        make_match(1, player_a.player_id, player_b.player_id, 2, 1),
     ]
 
-    config = {"standings_tiebreakers": ["gw", "omw", "random"]}
-
-    standings = calculate_standings(players, matches, config)
+    standings = calculate_standings(players, matches, CONFIG_GW_OMW_RANDOM)
 
     # A should be ranked 1, B ranked 2
     assert standings[0].player.player_id == player_a.player_id
@@ -469,90 +283,97 @@ def test_standings_different_tiebreaker_config(base_tournament_data):
     assert "gw" in standings[1].tiebreakers
 
 
+def test_standings_tied_players_share_rank(make_player, make_match):
+    """
+    Test competition ranking for fully tied players.
+
+    SCENARIO: A beats B, C beats D, all 2-0; only match points are configured
+    EXPECTED: A and C share rank 1, B and D share rank 3 ("1, 1, 3, 3")
+    """
+    players = [make_player(i + 1) for i in range(4)]
+    player_a, player_b, player_c, player_d = players
+
+    matches = [
+        make_match(1, winner.player_id, loser.player_id, 2, 0)
+        for winner, loser in [(player_a, player_b), (player_c, player_d)]
+    ]
+
+    standings = calculate_standings(players, matches, CONFIG_MATCH_POINTS_ONLY)
+
+    rank_by_player = {entry.player.player_id: entry.rank for entry in standings}
+    assert rank_by_player[player_a.player_id] == 1
+    assert rank_by_player[player_c.player_id] == 1
+    assert rank_by_player[player_b.player_id] == 3
+    assert rank_by_player[player_d.player_id] == 3
+
+    # Ties keep registration order
+    assert [entry.player.player_id for entry in standings] == [
+        player_a.player_id,
+        player_c.player_id,
+        player_b.player_id,
+        player_d.player_id,
+    ]
+
+
+def test_standings_registered_calculator_without_precomputed_values(
+    make_player, make_match, monkeypatch
+):
+    """
+    Test that a registered calculator outside the built-in four still runs.
+
+    SCENARIO: "seat" calculator (higher sequence_id wins) registered and configured
+    EXPECTED: Its values are recorded and break the tie between equal records
+    """
+    players = [make_player(i + 1) for i in range(4)]
+    player_a, player_b, player_c, player_d = players
+
+    def calculate_seat(player, matches, all_registrations, config):
+        return float(player.sequence_id)
+
+    monkeypatch.setitem(TIEBREAKER_CALCULATORS, "seat", calculate_seat)
+
+    matches = [
+        make_match(1, winner.player_id, loser.player_id, 2, 0)
+        for winner, loser in [(player_a, player_b), (player_c, player_d)]
+    ]
+
+    standings = calculate_standings(players, matches, {"standings_tiebreakers": ("seat",)})
+
+    assert [entry.player.player_id for entry in standings] == [
+        player_c.player_id,
+        player_a.player_id,
+        player_d.player_id,
+        player_b.player_id,
+    ]
+    assert [entry.tiebreakers["seat"] for entry in standings] == [3.0, 1.0, 4.0, 2.0]
+    assert [entry.rank for entry in standings] == [1, 2, 3, 4]
+
+
 # ===== Metadata Tests =====
 
 
-def test_standings_metadata_calculation(base_tournament_data):
+def test_standings_metadata_calculation(make_player, make_match):
     """Test that metadata (matches_played, bye_count, opponents) is calculated."""
-    player_a = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=1,
-        status=PlayerStatus.ACTIVE,
-    )
-    player_b = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=2,
-        status=PlayerStatus.ACTIVE,
-    )
-    player_c = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=3,
-        status=PlayerStatus.ACTIVE,
-    )
+    player_a = make_player(1)
+    player_b = make_player(2)
+    player_c = make_player(3)
 
     players = [player_a, player_b, player_c]
 
     matches = [
         # Round 1: A beats B, C gets bye
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=uuid4(),
-            round_number=1,
-            player1_id=player_a.player_id,
-            player2_id=player_b.player_id,
-            player1_wins=2,
-            player2_wins=0,
-        ),
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=uuid4(),
-            round_number=1,
-            player1_id=player_c.player_id,
-            player2_id=None,  # Bye
-            player1_wins=2,
-            player2_wins=0,
-        ),
+        make_match(1, player_a.player_id, player_b.player_id, 2, 0),
+        make_match(1, player_c.player_id, None, 2, 0),  # Bye
         # Round 2: A beats C, B gets bye
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=uuid4(),
-            round_number=2,
-            player1_id=player_a.player_id,
-            player2_id=player_c.player_id,
-            player1_wins=2,
-            player2_wins=1,
-        ),
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=uuid4(),
-            round_number=2,
-            player1_id=player_b.player_id,
-            player2_id=None,  # Bye
-            player1_wins=2,
-            player2_wins=0,
-        ),
+        make_match(2, player_a.player_id, player_c.player_id, 2, 1),
+        make_match(2, player_b.player_id, None, 2, 0),  # Bye
     ]
 
-    config = {"standings_tiebreakers": ["omw", "gw", "random"]}
-
-    standings = calculate_standings(players, matches, config)
+    standings = calculate_standings(players, matches, CONFIG_OMW_GW_RANDOM)
+    by_id = {s.player.player_id: s for s in standings}
 
     # Player A: 2 matches, 0 byes, faced B and C
-    a_standing = next(s for s in standings if s.player.player_id == player_a.player_id)
+    a_standing = by_id[player_a.player_id]
     assert a_standing.matches_played == 2
     assert a_standing.bye_count == 0
     assert len(a_standing.opponents_faced) == 2
@@ -560,69 +381,35 @@ def test_standings_metadata_calculation(base_tournament_data):
     assert str(player_c.player_id) in a_standing.opponents_faced
 
     # Player B: 2 matches, 1 bye, faced A only
-    b_standing = next(s for s in standings if s.player.player_id == player_b.player_id)
+    b_standing = by_id[player_b.player_id]
     assert b_standing.matches_played == 2
     assert b_standing.bye_count == 1
     assert len(b_standing.opponents_faced) == 1
     assert str(player_a.player_id) in b_standing.opponents_faced
 
     # Player C: 2 matches, 1 bye, faced A only
-    c_standing = next(s for s in standings if s.player.player_id == player_c.player_id)
+    c_standing = by_id[player_c.player_id]
     assert c_standing.matches_played == 2
     assert c_standing.bye_count == 1
     assert len(c_standing.opponents_faced) == 1
     assert str(player_a.player_id) in c_standing.opponents_faced
 
 
-def test_standings_game_record_calculation(base_tournament_data):
+def test_standings_game_record_calculation(make_player, make_match):
     """Test that game wins/losses/draws are calculated correctly."""
-    player_a = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=1,
-        status=PlayerStatus.ACTIVE,
-    )
-    player_b = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=2,
-        status=PlayerStatus.ACTIVE,
-    )
+    player_a = make_player(1)
+    player_b = make_player(2)
 
     players = [player_a, player_b]
 
     matches = [
         # Round 1: A wins 2-1
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=uuid4(),
-            round_number=1,
-            player1_id=player_a.player_id,
-            player2_id=player_b.player_id,
-            player1_wins=2,
-            player2_wins=1,
-        ),
+        make_match(1, player_a.player_id, player_b.player_id, 2, 1),
         # Round 2: A wins 2-0
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=uuid4(),
-            round_number=2,
-            player1_id=player_a.player_id,
-            player2_id=player_b.player_id,
-            player1_wins=2,
-            player2_wins=0,
-        ),
+        make_match(2, player_a.player_id, player_b.player_id, 2, 0),
     ]
 
-    config = {"standings_tiebreakers": ["gw", "omw", "random"]}
-
-    standings = calculate_standings(players, matches, config)
+    standings = calculate_standings(players, matches, CONFIG_GW_OMW_RANDOM)
 
     # Player A: 4 game wins, 1 game loss
     a_standing = standings[0]
@@ -638,49 +425,26 @@ def test_standings_game_record_calculation(base_tournament_data):
 # ===== Edge Cases =====
 
 
-def test_standings_dropped_player_included(base_tournament_data):
+def test_standings_dropped_player_included(make_player, make_match):
     """Test that dropped players appear in standings."""
-    player_a = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=1,
-        status=PlayerStatus.ACTIVE,
-    )
-    player_b = TournamentRegistration(
-        id=uuid4(),
-        tournament_id=base_tournament_data["tournament_id"],
-        player_id=uuid4(),
-        sequence_id=2,
-        status=PlayerStatus.DROPPED,  # Dropped!
-    )
+    player_a = make_player(1)
+    player_b = make_player(2, status=PlayerStatus.DROPPED)  # Dropped!
 
     players = [player_a, player_b]
 
     matches = [
         # Round 1: A beats B (before B dropped)
-        Match(
-            id=uuid4(),
-            tournament_id=base_tournament_data["tournament_id"],
-            component_id=base_tournament_data["component_id"],
-            round_id=base_tournament_data["round_id"],
-            round_number=1,
-            player1_id=player_a.player_id,
-            player2_id=player_b.player_id,
-            player1_wins=2,
-            player2_wins=0,
-        ),
+        make_match(1, player_a.player_id, player_b.player_id, 2, 0),
     ]
 
-    config = {"standings_tiebreakers": ["omw", "gw", "random"]}
-
-    standings = calculate_standings(players, matches, config)
+    standings = calculate_standings(players, matches, CONFIG_OMW_GW_RANDOM)
+    by_id = {s.player.player_id: s for s in standings}
 
     # Both players should appear in standings
     assert len(standings) == 2
 
     # B should have 0-1 record despite being dropped
-    b_standing = next(s for s in standings if s.player.player_id == player_b.player_id)
+    b_standing = by_id[player_b.player_id]
     assert b_standing.losses == 1
     assert b_standing.player.status == PlayerStatus.DROPPED
 